@@ -1,229 +1,91 @@
 # Daum_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+# 다음 뉴스 카테고리 어댑터. 공통 흐름은 crawler_engine.SiteCrawler 가 맡는다.
 import urllib.parse
-import json
-import subprocess
-
-
-# JSON 저장 폴더 설정
-NEWS_JSON_DIR = 'news_json'
-result_filename = os.path.join(NEWS_JSON_DIR, 'daum_News.json')  # news_json/daum_News.json
-
-def load_keywords():
-    with open('News_keyword.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    keywords = [item for cat in data['keywords'] for item in cat['items']]
-    exclude_keywords = [item for cat in data['exclude_keywords'] for item in cat['items']]
-    return keywords, exclude_keywords
-keywords, exclude_keywords = load_keywords()
-# 날짜 포맷팅 (모든 요일을 한국어로 변환)
-today_dt = datetime.now()
-day_map = {
-    'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일', 'Thursday': '목요일',
-    'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
-}
-eng_day = today_dt.strftime('%A')
-kor_day = day_map.get(eng_day, eng_day)  # 영어 요일을 한국어로 변환
-today = today_dt.strftime(f'%Y년 %m월 %d일 {kor_day}')
-
-urls = [
-    'https://news.daum.net/world',
-    'https://news.daum.net/china',
-    'https://news.daum.net/northamerica',
-    'https://news.daum.net/japan',
-    'https://news.daum.net/asia',
-    'https://news.daum.net/arab',
-    'https://news.daum.net/europe',
-    'https://news.daum.net/southamerica',
-    'https://news.daum.net/africa',
-    'https://news.daum.net/topic',
-    'https://news.daum.net/politics',
-    'https://news.daum.net/society',
-    'https://news.daum.net/economy',
-    'https://news.daum.net/climate',
-    'https://issue.daum.net/focus/241203'
-]
-
-result_set = set()
-processed_links = set()
-
-def extract_article_details(url):
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        summary_element = soup.select_one('strong.summary_view')
-        summary = summary_element.text.strip() if summary_element else ''
-        
-        img_element = soup.select_one('meta[property="og:image"]')
-        img_url = img_element['content'] if img_element else ''
-        if not img_url:
-            img_element = soup.select_one('img[alt="thumbnail"]')
-            img_url = img_element['src'] if img_element else ''
-        
-        return summary, img_url
-    except Exception as e:
-        print(f"요약/이미지 추출 실패 ({url}): {e}")
-        return '', ''
-
-def is_relevant_article(text_content):
-    if not keywords:
-        return True
-    text_lower = text_content.lower()
-    matching_keywords = [keyword.lower() for keyword in keywords if keyword.lower() in text_lower]
-    exclude_match = any(keyword.lower() in text_lower for keyword in exclude_keywords)
-    if len(matching_keywords) < 2:
-        return False
-    if exclude_match:
-        return False
-    return True
-
-def process_article(element, base_url, category):
-    href_link = element.get('href')
-    if not href_link or 'javascript' in href_link:
-        return False
-    
-    if not href_link.startswith('http'):
-        href_link = 'https://news.daum.net' + href_link
-    
-    title_element = element.find('span', class_='tit_txt')
-    text_content = title_element.text.strip() if title_element else ''
-    
-    if not text_content:
-        data_title = element.get('data-title')
-        text_content = urllib.parse.unquote(data_title) if data_title else ''
-    
-    if not text_content:
-        return False
-    
-    if href_link in processed_links:
-        return False
-    
-    if not is_relevant_article(text_content):
-        return False
-    
-    time_element = element.select_one('span.txt_info:last-of-type')
-    summary, img_url = extract_article_details(href_link)
-    
-    formatted_time = ''
-    if time_element:
-        time_str = time_element.text.strip()
-        try:
-            published_time = datetime.strptime(time_str, '%Y.%m.%d. %H:%M:%S')
-            formatted_time = published_time.strftime('%Y-%m-%d %H:%M')
-        except ValueError:
-            try:
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                full_time_str = f'{current_date} {time_str}'
-                published_time = datetime.strptime(full_time_str, '%Y-%m-%d %H:%M')
-                formatted_time = published_time.strftime('%Y-%m-%d %H:%M')
-            except ValueError:
-                formatted_time = datetime.now().strftime('%Y-%m-%d %H:%M')
-    
-    result_set.add((text_content, formatted_time, href_link, summary, img_url))
-    processed_links.add(href_link)
-    print(f"추출된 기사: {text_content} ({formatted_time})")
-    return True
-
-def get_news_from_page(url, page, category):
-    try:
-        full_url = f"{url}?page={page}" if 'breakingnews' in url else url
-        response = requests.get(full_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        if category in ['politics', 'society', 'economy', 'climate']:
+from datetime import datetime
+
+from crawler_engine import SiteCrawler, run_cli
+
+# 이 카테고리들은 박스형 레이아웃이라 선택자가 다르다
+BOX_CATEGORIES = ['politics', 'society', 'economy', 'climate']
+
+
+class DaumCrawler(SiteCrawler):
+    source = 'daum'
+    result_filename = 'daum_News.json'
+    urls = [
+        'https://news.daum.net/world',
+        'https://news.daum.net/china',
+        'https://news.daum.net/northamerica',
+        'https://news.daum.net/japan',
+        'https://news.daum.net/asia',
+        'https://news.daum.net/arab',
+        'https://news.daum.net/europe',
+        'https://news.daum.net/southamerica',
+        'https://news.daum.net/africa',
+        'https://news.daum.net/topic',
+        'https://news.daum.net/politics',
+        'https://news.daum.net/society',
+        'https://news.daum.net/economy',
+        'https://news.daum.net/climate',
+        'https://issue.daum.net/focus/241203'
+    ]
+
+    list_scope = '.box_news_headline2, .box_news_block, .list_newsheadline2, .list_newsbasic'
+    title_selector = 'span.tit_txt'
+    time_selector = 'span.txt_info:last-of-type'
+    time_formats = ('%Y.%m.%d. %H:%M:%S', '%H:%M')  # 시:분 만 있으면 오늘 날짜
+    time_required = False
+
+    include_mode = 'substring'
+    exclude_mode = 'substring'
+
+    # 이미지는 상세 페이지에서
+    detail_rules = {'img': [('meta[property="og:image"]', 'content'), ('img[alt="thumbnail"]', 'src')]}
+    detail_scope = 'meta, img'
+
+    max_workers = 3
+    request_rate = 0.5  # news.daum.net 2초에 한 번 (상세 v.daum.net 은 제한 없음)
+
+    def select_items(self, soup, list_url):
+        category = list_url.split('?')[0].split('/')[-1] if 'daum.net' in list_url else 'special'
+        if category in BOX_CATEGORIES:
             selector = '.box_comp.box_news_headline2 .item_newsheadline2, .box_comp.box_news_block .item_newsblock'
         else:
             selector = '.list_newsheadline2 .item_newsheadline2, .list_newsbasic .item_newsbasic'
-        
-        relevant_elements = soup.select(selector)
-        article_count = len(relevant_elements)
-
-        print(f"URL: {full_url}, 기사 수: {article_count}")
-
-        if article_count == 0:
-            return False
-
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [executor.submit(process_article, element, url, category) for element in relevant_elements]
-            results = [future.result() for future in as_completed(futures)]
-        
-        return any(results)
-    except Exception as e:
-        print(f"페이지 처리 실패 ({url}): {e}")
-        return False
-
-def scrape_category(url):
-    category = url.split('/')[-1] if 'daum.net' in url else 'special'
-    print(f"카테고리: {url}")
-    
-    if 'breakingnews' in url:
-        page = 1
-        while True:
-            if not get_news_from_page(url, page, category):
-                break
-            page += 1
-            time.sleep(2)
-    else:
-        get_news_from_page(url, 1, category)
-        time.sleep(2)
-
-def load_existing_json():
-    if os.path.exists(result_filename):
-        try:
-            with open(result_filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"JSON 파일 읽기 실패: {e}")
-    return []
-
-def save_to_json():
-    print(f"최종 결과 수: {len(result_set)}")
-    sorted_result = sorted(result_set, key=lambda x: x[1] if x[1] else '0000-00-00 00:00', reverse=True)
-
-    from collections import defaultdict
-    articles_by_date = defaultdict(list)
-    for title, time, link, summary, img_url in sorted_result:
-        date_str = datetime.strptime(time, '%Y-%m-%d %H:%M').strftime('%Y년 %m월 %d일 %A')
-        articles_by_date[date_str].append({
-            "title": title,
-            "time": datetime.strptime(time, '%Y-%m-%d %H:%M').strftime('%Y-%m-%dT%H:%M:%S+09:00'),
-            "img": img_url,
-            "url": link,
-            "original_url": link
-        })
-
-    existing_data = load_existing_json()
-    existing_urls = set()
-    existing_by_date = defaultdict(list)
-
-    for date_group in existing_data:
-        date = date_group['date']
-        for article in date_group['articles']:
-            existing_urls.add(article['url'])
-            existing_by_date[date].append(article)
-
-    for date, articles in articles_by_date.items():
-        for article in articles:
-            if article['url'] not in existing_urls:
-                existing_by_date[date].append(article)
-                existing_urls.add(article['url'])
-
-    json_data = [{"date": date, "articles": articles} for date, articles in sorted(existing_by_date.items())]
-
-    with open(result_filename, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
-
-    print(f'Results saved to {result_filename}')
-
-for url in urls:
-    scrape_category(url)
-
-save_to_json()
+        return soup.select(selector)
+
+    def format_time(self, dt):
+        return dt.strftime('%Y-%m-%dT%H:%M:00+09:00')
+
+    def title_text(self, element):
+        # 제목 요소가 비어 있으면 data-title 속성을 쓴다
+        title = super().title_text(element)
+        if not title and element.get('data-title'):
+            title = urllib.parse.unquote(element['data-title'])
+        return title
+
+    def link_href(self, element):
+        href = super().link_href(element)
+        return None if href and 'javascript' in href else href
+
+    def parse_time(self, text, formats=None):
+        # 형식을 모르면 지금 시간
+        return super().parse_time(text, formats) or datetime.now()
+
+    def parse_item(self, element, list_url):
+        item = super().parse_item(element, list_url)
+        if item is not None and not item['time']:
+            item['time'] = self.format_time(datetime.now())
+        return item
+
+    def date_label(self, article):
+        # 기사 시간의 날짜로 묶는다 (예전 파일과 같은 영어 요일 라벨)
+        return datetime.strptime(article['time'][:16], '%Y-%m-%dT%H:%M').strftime('%Y년 %m월 %d일 %A')
+
+
+crawler = DaumCrawler()
+store = crawler.store
+main = crawler.run
+
+if __name__ == "__main__":
+    run_cli(crawler)
@@ -1,147 +1,27 @@
 # FnNews_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-import json
-import sys
-import os
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
-#from News_keyword import keywords, exclude_keywords  # keyword.py에서 키워드 가져오기
+# 파이낸셜뉴스 속보 어댑터. 공통 흐름은 crawler_engine.SiteCrawler 가 맡는다.
+from crawler_engine import SiteCrawler, run_cli
 
-# JSON 저장 폴더 설정
-NEWS_JSON_DIR = 'news_json'
-result_filename = os.path.join(NEWS_JSON_DIR, 'Fn_News.json')
 
-def load_keywords():
-    with open('News_keyword.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    keywords = [item for cat in data['keywords'] for item in cat['items']]
-    exclude_keywords = [item for cat in data['exclude_keywords'] for item in cat['items']]
-    return keywords, exclude_keywords
-keywords, exclude_keywords = load_keywords()
-# 날짜 포맷팅 (모든 요일을 한국어로 변환)
-today_dt = datetime.now()
-day_map = {
-    'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일', 'Thursday': '목요일',
-    'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
-}
-eng_day = today_dt.strftime('%A')
-kor_day = day_map.get(eng_day, eng_day)  # 영어 요일을 한국어로 변환
-today = today_dt.strftime(f'%Y년 %m월 %d일 {kor_day}')
-urls = ['https://www.fnnews.com/newsflash']
-processed_links = set()
+class FnNewsCrawler(SiteCrawler):
+    source = 'fnnews'
+    result_filename = 'Fn_News.json'
+    urls = ['https://www.fnnews.com/newsflash']
 
-def is_relevant_article(text_content):
-    words = set(re.findall(r'\b\w+\b', text_content.lower()))
-    matching_keywords = [keyword.lower() for keyword in keywords if keyword.lower() in words]
-    exclude_match = any(keyword.lower() in words for keyword in exclude_keywords)
-    return len(matching_keywords) >= 2 and not exclude_match
+    list_scope = 'div.wrap_txt'
+    item_selector = 'div.wrap_txt'
+    title_selector = 'strong.tit_thumb a'
+    time_selector = 'span.caption'
+    time_formats = ('%Y.%m.%d %H:%M',)
+    img_selector = 'img'
 
-def get_existing_links():
-    try:
-        with open(result_filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return {article['url'] for day in data for article in day['articles']}
-    except FileNotFoundError:
-        return set()
+    include_mode = 'word'
+    exclude_mode = 'word'
 
-def process_article(element):
-    title_element = element.find('strong', class_='tit_thumb')
-    if not title_element:
-        return None
 
-    link_element = title_element.find('a')
-    if not link_element:
-        return None
-
-    href_link = link_element.get('href')
-    if not href_link.startswith('http'):
-        href_link = 'https://www.fnnews.com' + href_link
-
-    if href_link in processed_links:
-        return None
-
-    title = link_element.text.strip()
-    time_element = element.find('span', class_='caption')
-    if not time_element:
-        return None
-
-    time_str = time_element.text.strip()
-    try:
-        published_time = datetime.strptime(time_str, '%Y.%m.%d %H:%M')
-        formatted_time = published_time.isoformat()
-    except ValueError:
-        return None
-
-    img_element = element.find('img')
-    img_url = img_element.get('src') if img_element else ''
-
-    text_content = title
-    if is_relevant_article(text_content):
-        processed_links.add(href_link)
-        return {
-            'title': title,
-            'time': formatted_time,
-            'img': img_url,
-            'url': href_link,
-            'original_url': href_link
-        }
-    return None
-
-def scrape_page(url):
-    print(f"Scraping URL: {url}")
-    articles = []
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        relevant_elements = soup.select('div.wrap_txt')
-        print(f"Found {len(relevant_elements)} articles")
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(process_article, element) for element in relevant_elements]
-            for future in as_completed(futures):
-                article = future.result()
-                if article:
-                    articles.append(article)
-        
-        return articles
-    except Exception as e:
-        print(f"페이지 처리 실패 ({url}): {e}")
-        return []
-
-def save_to_json(new_articles):
-    try:
-        with open(result_filename, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
-    except FileNotFoundError:
-        existing_data = []
-
-    today_data = next((d for d in existing_data if d['date'] == today), None)
-    if today_data:
-        today_data['articles'].extend(new_articles)
-    else:
-        existing_data.append({'date': today, 'articles': new_articles})
-
-    with open(result_filename, 'w', encoding='utf-8') as f:
-        json.dump(existing_data, f, ensure_ascii=False, indent=2)
-    print(f"Saved {len(new_articles)} articles to {result_filename}")
-
-def main():
-    global processed_links
-    processed_links = get_existing_links()
-    all_articles = []
-
-    for url in urls:
-        articles = scrape_page(url)
-        all_articles.extend(articles)
-
-    if all_articles:
-        save_to_json(all_articles)
-    else:
-        print("No new articles found")
+crawler = FnNewsCrawler()
+store = crawler.store
+main = crawler.run
 
 if __name__ == "__main__":
-    main()
+    run_cli(crawler)
@@ -0,0 +1,193 @@
+# article_store.py
+# 기사 저장소: 소스별·날짜별 JSONL 샤드에 새 기사만 덧붙인다.
+#   news_json/shards/<소스>/<YYYY-MM-DD>.jsonl   (한 줄 = {"date": 날짜 라벨, "article": {...}})
+# 예전 형식([{date, articles}]) 파일은 materialize() 로 필요할 때 만든다.
+# 샤드는 덧붙이기만 하므로 검색/스토리 인덱스, Parquet 아카이브는 파일마다 읽은 바이트 수만 기억해 두고
+# 그 뒤에 붙은 줄만 읽어 따라잡는다 (iter_appended). 소스별 워크플로가 커밋한 다른 소스의 샤드도 이렇게 본다.
+# 사용법: python article_store.py materialize news_json/naver_News.json [...]
+import json
+import os
+import re
+import sys
+import tempfile
+
+NEWS_JSON_DIR = 'news_json'
+SHARD_ROOT = os.path.join(NEWS_JSON_DIR, 'shards')
+
+_DATE_LABEL_RE = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+
+
+def shard_key(date_label):
+    """'2025년 04월 18일 금요일' -> '2025-04-18'. 형식이 다르면 라벨을 파일명으로 쓸 수 있게 정리한다."""
+    m = _DATE_LABEL_RE.search(date_label)
+    if m:
+        year, month, day = m.groups()
+        return f'{year}-{int(month):02d}-{int(day):02d}'
+    return re.sub(r'[^\w-]+', '_', date_label).strip('_') or 'undated'
+
+
+class ArticleStore:
+    def __init__(self, legacy_filename, shard_root=SHARD_ROOT):
+        self.legacy_filename = legacy_filename
+        self.name = os.path.splitext(os.path.basename(legacy_filename))[0]
+        self.shard_dir = os.path.join(shard_root, self.name)
+
+    def shard_path(self, date_label):
+        return os.path.join(self.shard_dir, f'{shard_key(date_label)}.jsonl')
+
+    def _shard_files(self):
+        if not os.path.isdir(self.shard_dir):
+            return []
+        return [os.path.join(self.shard_dir, name)
+                for name in sorted(os.listdir(self.shard_dir)) if name.endswith('.jsonl')]
+
+    def ensure_imported(self):
+        """샤드가 아직 없으면 예전 JSON 파일 내용을 한 번 옮겨 온다."""
+        if os.path.isdir(self.shard_dir):
+            return
+        os.makedirs(self.shard_dir, exist_ok=True)
+        if not os.path.exists(self.legacy_filename):
+            return
+        # 파일 전체를 메모리에 올리지 않고 하루치씩 옮긴다
+        from news_reader import iter_records  # news_reader 가 shard_key 를 쓰므로 여기서 import
+        day_label, day_articles = None, []
+        try:
+            for date_label, article in iter_records(self.legacy_filename):
+                if date_label != day_label and day_articles:
+                    self._write_lines(day_label, day_articles)
+                    day_articles = []
+                day_label = date_label
+                day_articles.append(article)
+        except ValueError:
+            print(f"{self.legacy_filename} 파일이 손상됨. 읽을 수 있는 곳까지만 가져옴.")
+        if day_articles:
+            self._write_lines(day_label, day_articles)
+        print(f"{self.legacy_filename} -> {self.shard_dir} 가져오기 완료")
+
+    def _write_lines(self, date_label, articles):
+        lines = ''.join(json.dumps({'date': date_label, 'article': article}, ensure_ascii=False) + '\n'
+                        for article in articles)
+        with open(self.shard_path(date_label), 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+    def _read_shard(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # 쓰다가 끊긴 마지막 줄 등은 건너뛴다
+                    continue
+
+    def append(self, date_label, articles):
+        """그날 샤드에 없는 URL 의 기사만 덧붙이고, 실제로 추가된 기사 목록을 돌려준다."""
+        self.ensure_imported()
+        path = self.shard_path(date_label)
+        existing_urls = set()
+        if os.path.exists(path):
+            existing_urls = {record['article'].get('url') for record in self._read_shard(path)}
+        new_articles = []
+        for article in articles:
+            if article['url'] in existing_urls:
+                continue
+            existing_urls.add(article['url'])
+            new_articles.append(article)
+        if new_articles:
+            self._write_lines(date_label, new_articles)
+        return new_articles
+
+    def iter_days(self):
+        """(날짜 라벨, 기사 목록) 을 날짜 순서대로 하나씩 돌려준다."""
+        self.ensure_imported()
+        for path in self._shard_files():
+            days = {}
+            for record in self._read_shard(path):
+                days.setdefault(record['date'], []).append(record['article'])
+            yield from days.items()
+
+    def iter_urls(self):
+        for _, articles in self.iter_days():
+            for article in articles:
+                yield article['url']
+
+    def materialize(self, path=None):
+        """샤드를 읽어 예전 형식의 JSON 파일을 만든다. 하루치씩 써서 메모리는 하루 분량만 쓴다."""
+        path = path or self.legacy_filename
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        count = 0
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for date_label, articles in self.iter_days():
+                body = json.dumps({'date': date_label, 'articles': articles}, ensure_ascii=False, indent=2)
+                # json.dump(list, indent=2) 와 같은 모양이 되도록 한 단계 들여쓴다
+                f.write(',\n' if count else '[\n')
+                f.write('\n'.join('  ' + line for line in body.split('\n')))
+                count += 1
+            f.write('\n]' if count else '[]')
+        os.replace(tmp_path, path)
+        print(f"{path} 생성 완료 ({count}일치)")
+        return path
+
+
+def _read_appended(path, offset):
+    """offset 바이트 뒤에 붙은 완전한 줄만 읽어 (레코드 목록, 새 offset). 쓰는 중인 마지막 줄은 다음에 읽는다."""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b'\n') + 1
+    records = []
+    for line in data[:end].splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records, offset + end
+
+
+def iter_appended(stores, offsets, since=None, import_legacy=True):
+    """stores: {소스 이름: ArticleStore}, offsets: {'<샤드 폴더>/<파일>': 읽은 바이트} (제자리에서 갱신된다).
+    지난번 이후 샤드에 붙은 기사를 (소스 이름, 날짜 라벨, 기사 목록) 으로 돌려준다.
+    since: 'YYYY-MM-DD' 를 주면 그날 이후 샤드만 본다. offsets 는 파일 하나를 다 돌려준 뒤에 갱신된다.
+    import_legacy=False 면 샤드 폴더가 없는 소스는 예전 파일을 옮겨 오지 않고 건너뛴다."""
+    for source, store in stores.items():
+        if import_legacy:
+            store.ensure_imported()
+        for path in store._shard_files():
+            name = os.path.basename(path)
+            if since and name[:-len('.jsonl')] < since:
+                continue
+            key = f'{store.name}/{name}'
+            offset = offsets.get(key, 0)
+            size = os.path.getsize(path)
+            if size == offset:
+                continue
+            if size < offset:
+                # 덧붙이기만 하는 파일이 줄었다면 다시 쓴 것이므로 처음부터 읽는다
+                offset = 0
+            records, new_offset = _read_appended(path, offset)
+            days = {}
+            for record in records:
+                days.setdefault(record['date'], []).append(record['article'])
+            for date_label, articles in days.items():
+                yield source, date_label, articles
+            offsets[key] = new_offset
+
+
+def main(argv):
+    if len(argv) < 2 or argv[0] != 'materialize':
+        print("사용법: python article_store.py materialize <news_json/파일.json> [...]")
+        return 1
+    for legacy_filename in argv[1:]:
+        ArticleStore(legacy_filename).materialize()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
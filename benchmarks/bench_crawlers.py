@@ -0,0 +1,155 @@
+# benchmarks/bench_crawlers.py
+# 네트워크 없이 크롤러 10개의 목록 파싱 + 관련성 필터 + 상세 추출 경로를 돌려 본다.
+# HTTP 요청은 benchmarks/fixtures 의 저장된 페이지로 대신하고 (fixture_adapter),
+# 상태 파일(.crawler_state)은 임시 폴더에 만들어 실제 인덱스/캐시를 건드리지 않는다.
+# 소스별 pages/sec, articles/sec, 최대 메모리(tracemalloc), 제목 단계에서 생략한 상세 요청 수와
+# 관련성 판단(is_relevant) 처리량을 JSON 으로 낸다. CRAWLER_RELEVANCE_POLICY=always 로 제목 단계 필터를 끄고 비교할 수 있다.
+# 사용법: python benchmarks/bench_crawlers.py [naver daum ...] [--repeat 3] [--json] [--output result.json]
+import argparse
+import contextlib
+import glob
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 크롤러 모듈을 import 하기 전에 상태 폴더를 임시 폴더로 돌린다
+STATE_DIR = tempfile.mkdtemp(prefix='bench_crawlers_')
+os.environ['CRAWLER_STATE_DIR'] = STATE_DIR
+
+import detail_cache  # noqa: E402
+import fixture_adapter  # noqa: E402
+import http_cache  # noqa: E402
+import http_client  # noqa: E402
+import news_reader  # noqa: E402
+from crawl_runner import SOURCES  # noqa: E402
+
+
+def list_urls(crawler):
+    """run() 이 처음 받는 목록 페이지 URL 들 (페이지 넘김은 1페이지만)."""
+    return [crawler.page_url(url, 1) for url in crawler.section_urls()]
+
+
+def reset_state(crawler, run_id):
+    """매 실행을 처음 상태로: 본 URL/제목, 조건부 GET 캐시, 상세 캐시를 비운다."""
+    crawler.start_run(persistent=False)
+    http_cache._cache = http_cache.HttpCache(os.path.join(STATE_DIR, f'http_cache_{run_id}.sqlite3'))
+    detail_cache._cache = detail_cache.DetailCache(os.path.join(STATE_DIR, f'detail_cache_{run_id}.sqlite3'))
+
+
+def crawl_once(crawler, adapter, run_id):
+    articles = 0
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        reset_state(crawler, run_id)
+        adapter.requests.clear()
+        start = time.perf_counter()
+        for url in list_urls(crawler):
+            articles += len(crawler.scrape_page(url))
+        elapsed = time.perf_counter() - start
+    return elapsed, articles, dict(adapter.requests)
+
+
+def load_titles():
+    titles = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'news_json', '*.json'))):
+        titles.extend(article['title'] for _, article in news_reader.iter_articles(path, fields=('title',))
+                      if article['title'])
+    return titles
+
+
+def relevance_rate(crawler, titles):
+    start = time.perf_counter()
+    for title in titles:
+        crawler.is_relevant(title)
+    return len(titles) / (time.perf_counter() - start)
+
+
+def bench_source(name, adapter, titles, repeat):
+    crawler = importlib.import_module(SOURCES[name]).crawler
+    best = None
+    for i in range(repeat):
+        result = crawl_once(crawler, adapter, f'{name}_{i}')
+        if best is None or result[0] < best[0]:
+            best = result
+    elapsed, articles, requests = best
+
+    # 메모리는 따로 한 번 더 돌려서 잰다 (tracemalloc 이 있으면 느려지므로 시간 측정과 분리)
+    tracemalloc.start()
+    crawl_once(crawler, adapter, f'{name}_mem')
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    list_pages = sum(n for (source, kind), n in requests.items() if kind == 'list')
+    detail_pages = sum(n for (source, kind), n in requests.items() if kind == 'detail')
+    pages = list_pages + detail_pages
+    return {
+        'list_pages': list_pages,
+        'detail_pages': detail_pages,
+        'unmatched_requests': requests.get(('unmatched', 'unmatched'), 0),
+        'articles': articles,
+        'detail_avoided': crawler.metrics.counters['detail_avoided'],
+        'seconds': round(elapsed, 4),
+        'pages_per_sec': round(pages / elapsed, 1) if elapsed else None,
+        'articles_per_sec': round(articles / elapsed, 1) if elapsed else None,
+        'peak_memory_kib': round(peak / 1024, 1),
+        'relevance_titles_per_sec': round(relevance_rate(crawler, titles), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 오프라인 벤치마크 (저장된 페이지 사용)')
+    parser.add_argument('sources', nargs='*', help=f"소스 이름 (기본: 전체) {', '.join(SOURCES)}")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+    parser.add_argument('--output', help='결과 JSON 을 저장할 파일')
+    args = parser.parse_args()
+    unknown = [name for name in args.sources if name not in SOURCES]
+    if unknown:
+        parser.error(f"알 수 없는 소스: {', '.join(unknown)}")
+    names = args.sources or list(SOURCES)
+
+    adapter = fixture_adapter.install(http_client.get_session())
+    titles = load_titles()
+    results = {'repeat': args.repeat, 'relevance_titles': len(titles), 'sources': {}}
+    try:
+        for name in names:
+            results['sources'][name] = bench_source(name, adapter, titles, args.repeat)
+    finally:
+        shutil.rmtree(STATE_DIR, ignore_errors=True)
+
+    total_seconds = sum(r['seconds'] for r in results['sources'].values())
+    total_pages = sum(r['list_pages'] + r['detail_pages'] for r in results['sources'].values())
+    total_articles = sum(r['articles'] for r in results['sources'].values())
+    results['total'] = {
+        'pages': total_pages,
+        'articles': total_articles,
+        'seconds': round(total_seconds, 4),
+        'pages_per_sec': round(total_pages / total_seconds, 1) if total_seconds else None,
+        'articles_per_sec': round(total_articles / total_seconds, 1) if total_seconds else None,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    print(f"{'source':<10} {'pages':>6} {'articles':>8} {'pages/s':>9} {'articles/s':>10} "
+          f"{'peak KiB':>9} {'relevance/s':>12}")
+    for name, r in results['sources'].items():
+        print(f"{name:<10} {r['list_pages'] + r['detail_pages']:>6} {r['articles']:>8} {r['pages_per_sec']:>9} "
+              f"{r['articles_per_sec']:>10} {r['peak_memory_kib']:>9} {r['relevance_titles_per_sec']:>12,.0f}")
+    t = results['total']
+    print(f"{'total':<10} {t['pages']:>6} {t['articles']:>8} {t['pages_per_sec']:>9} {t['articles_per_sec']:>10}")
+
+
+if __name__ == '__main__':
+    main()
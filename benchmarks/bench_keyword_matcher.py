@@ -0,0 +1,126 @@
+# benchmarks/bench_keyword_matcher.py
+# 기존 크롤러별 키워드 루프와 keyword_matcher 의 처리량(titles/sec)을 비교한다.
+# 사용법: python benchmarks/bench_keyword_matcher.py [--repeat 3] [--json]
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from keyword_matcher import KeywordMatcher  # noqa: E402
+
+
+def load_titles():
+    titles = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'news_json', '*.json'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for day in data:
+            for article in day['articles']:
+                text = article.get('title', '')
+                if article.get('summary'):
+                    text = f"{text} {article['summary']}"
+                titles.append(text)
+    return titles
+
+
+# --- 기존 크롤러의 is_relevant_article 구현 (baseline) ---
+
+def legacy_regex(text, keywords, exclude_keywords):
+    # Naver / YNA: 포함은 re.search 부분 문자열, 제외는 단어 집합
+    words = set(re.findall(r'\b\w+\b', text.lower()))
+    matching = [k for k in keywords if re.search(re.escape(k.lower()), text.lower())]
+    exclude = any(k.lower() in words for k in exclude_keywords)
+    return len(matching) >= 2 and not exclude
+
+
+def legacy_substring(text, keywords, exclude_keywords):
+    # Daum / Google: 포함·제외 모두 부분 문자열
+    lowered = text.lower()
+    matching = [k.lower() for k in keywords if k.lower() in lowered]
+    exclude = any(k.lower() in lowered for k in exclude_keywords)
+    return len(matching) >= 2 and not exclude
+
+
+def legacy_words(text, keywords, exclude_keywords):
+    # Nate / FnNews / FNToday: 포함·제외 모두 단어 집합
+    words = set(re.findall(r'\b\w+\b', text.lower()))
+    matching = [k.lower() for k in keywords if k.lower() in words]
+    exclude = any(k.lower() in words for k in exclude_keywords)
+    return len(matching) >= 2 and not exclude
+
+
+def matcher_regex(result):
+    return result.include_count() >= 2 and not result.has_exclude(whole_word=True)
+
+
+def matcher_substring(result):
+    return result.include_count() >= 2 and not result.has_exclude()
+
+
+def matcher_words(result):
+    return result.include_count(whole_word=True) >= 2 and not result.has_exclude(whole_word=True)
+
+
+VARIANTS = [
+    ('regex (Naver/YNA)', legacy_regex, matcher_regex),
+    ('substring (Daum/Google)', legacy_substring, matcher_substring),
+    ('words (Nate/FnNews/FNToday)', legacy_words, matcher_words),
+]
+
+
+def timed(fn, titles, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in titles:
+            fn(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(titles) / best if best else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 매칭 벤치마크')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+    args = parser.parse_args()
+
+    build_start = time.perf_counter()
+    matcher = KeywordMatcher.from_file(os.path.join(ROOT, 'News_keyword.json'))
+    build_ms = (time.perf_counter() - build_start) * 1000
+    keywords, exclude_keywords = matcher.keywords, matcher.exclude_keywords
+    titles = load_titles()
+
+    results = {'titles': len(titles), 'matcher_build_ms': round(build_ms, 2), 'variants': []}
+    for name, legacy_fn, matcher_fn in VARIANTS:
+        mismatches = sum(
+            1 for text in titles
+            if legacy_fn(text, keywords, exclude_keywords) != matcher_fn(matcher.match(text))
+        )
+        legacy_rate = timed(lambda t: legacy_fn(t, keywords, exclude_keywords), titles, args.repeat)
+        matcher_rate = timed(lambda t: matcher_fn(matcher.match(t)), titles, args.repeat)
+        results['variants'].append({
+            'name': name,
+            'legacy_titles_per_sec': round(legacy_rate, 1),
+            'matcher_titles_per_sec': round(matcher_rate, 1),
+            'speedup': round(matcher_rate / legacy_rate, 2),
+            'mismatches': mismatches,
+        })
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    print(f"titles: {results['titles']}, matcher build: {results['matcher_build_ms']} ms")
+    for v in results['variants']:
+        print(f"{v['name']:<30} legacy {v['legacy_titles_per_sec']:>10,.0f}/s  "
+              f"matcher {v['matcher_titles_per_sec']:>10,.0f}/s  x{v['speedup']}  mismatches={v['mismatches']}")
+
+
+if __name__ == '__main__':
+    main()
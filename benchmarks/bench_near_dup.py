@@ -0,0 +1,91 @@
+# benchmarks/bench_near_dup.py
+# Google_Crawler 의 예전 방식(받아들인 제목 전부와 fuzz.ratio 비교)과 near_dup_index 를 비교한다.
+# 같은 제목 순서로 중복 제거를 돌려 걸린 시간, 비교 횟수, 결과 차이를 본다.
+# 사용법: python benchmarks/bench_near_dup.py [--limit 1500] [--threshold 35] [--json]
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fuzzywuzzy import fuzz  # noqa: E402
+
+from near_dup_index import DEFAULT_THRESHOLD, NearDupIndex, normalize_title  # noqa: E402
+
+
+def load_titles():
+    titles = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'news_json', '*.json'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for day in data:
+            titles.extend(article['title'] for article in day['articles'] if article.get('title'))
+    return titles
+
+
+def dedupe_brute_force(titles, threshold):
+    accepted, comparisons = [], 0
+    for title in titles:
+        norm = normalize_title(title)
+        for other in accepted:
+            comparisons += 1
+            if fuzz.ratio(norm, other) >= threshold:
+                break
+        else:
+            accepted.append(norm)
+    return accepted, comparisons
+
+
+def dedupe_index(titles, threshold):
+    index = NearDupIndex('bench', path=None, threshold=threshold)
+    accepted = []
+    for title in titles:
+        if index.find(title) is None:
+            index.add(title)
+            accepted.append(normalize_title(title))
+    return accepted, index.comparisons
+
+
+def main():
+    parser = argparse.ArgumentParser(description='유사 제목 중복 제거 벤치마크')
+    parser.add_argument('--limit', type=int, default=1500, help='사용할 제목 수')
+    parser.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+    args = parser.parse_args()
+
+    titles = load_titles()[:args.limit]
+    results = {'titles': len(titles), 'threshold': args.threshold}
+    for name, fn in (('brute_force', dedupe_brute_force), ('index', dedupe_index)):
+        start = time.perf_counter()
+        accepted, comparisons = fn(titles, args.threshold)
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            'seconds': round(elapsed, 3),
+            'titles_per_sec': round(len(titles) / elapsed, 1),
+            'comparisons': comparisons,
+            'accepted': len(accepted),
+            '_accepted': set(accepted),
+        }
+    brute, index = results['brute_force'].pop('_accepted'), results['index'].pop('_accepted')
+    results['accepted_only_by_brute_force'] = len(brute - index)
+    results['accepted_only_by_index'] = len(index - brute)
+    results['speedup'] = round(results['brute_force']['seconds'] / results['index']['seconds'], 2)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    print(f"titles: {results['titles']}, threshold: {results['threshold']}")
+    for name in ('brute_force', 'index'):
+        r = results[name]
+        print(f"{name:<12} {r['seconds']:>8.3f}s  {r['titles_per_sec']:>10,.1f} titles/s  "
+              f"comparisons {r['comparisons']:>10,}  accepted {r['accepted']}")
+    print(f"speedup x{results['speedup']}, accepted only by brute force {results['accepted_only_by_brute_force']}, "
+          f"only by index {results['accepted_only_by_index']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_parser.py
+# 저장해 둔 목록/상세 페이지(benchmarks/fixtures)로 HTML 파서 백엔드별 속도를 비교한다.
+# 백엔드 x (전체 파싱 / 크롤러의 list_scope·detail_scope 만 파싱) 조합마다
+# 페이지당 파싱 시간과 크롤러 선택자가 찾은 요소 수를 본다 (요소 수는 모두 같아야 한다).
+# 사용법: python benchmarks/bench_parser.py [--repeat 5] [--json]
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import html_parser  # noqa: E402
+from crawl_runner import SOURCES  # noqa: E402
+
+FIXTURE_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+
+# 크롤러가 파싱 직후 쓰는 선택자 (소스, 페이지 종류) -> 선택자
+SELECTORS = {
+    ('naver', 'list'): 'div.section_latest_article ul li',
+    ('naver', 'detail'): 'span[class*="ARTICLE_DATE_TIME"], .media_end_summary, #img1',
+    ('daum', 'list'): '.list_newsheadline2 .item_newsheadline2, .list_newsbasic .item_newsbasic',
+    ('daum', 'detail'): 'meta[property="og:image"], img[alt="thumbnail"]',
+    ('yna', 'list'): 'ul.list01 li',
+    ('nate', 'list'): 'div.mlt01',
+    ('skydaily', 'list'): 'div.picarticle a',
+    ('skydaily', 'detail'): 'div.article_txt',
+    ('voa', 'list'): 'div.media-block',
+    ('voa', 'detail'): 'p.perex, p[class*="perex"]',
+    ('fnnews', 'list'): 'div.wrap_txt',
+    ('fntoday', 'list'): 'div.list-block',
+    ('gukje', 'list'): 'ul.type2 li',
+    ('google', 'list'): 'article',
+}
+
+
+def load_pages():
+    with open(os.path.join(FIXTURE_DIR, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    pages = []
+    for page in manifest['pages']:
+        with open(os.path.join(FIXTURE_DIR, page['file']), 'rb') as f:
+            page['text'] = f.read().decode(page.get('encoding', 'utf-8'))
+        crawler = importlib.import_module(SOURCES[page['source']]).crawler
+        page['scope'] = crawler.list_scope if page['kind'] == 'list' else crawler.detail_scope
+        pages.append(page)
+    return pages
+
+
+def timed_parse(text, scope, backend, selector, repeat):
+    best = None
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = html_parser.parse(text, scope, backend)
+        count = len(soup.select(selector))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+    args = parser.parse_args()
+
+    pages = load_pages()
+    backends = html_parser.available_backends()
+    results = {'pages': len(pages), 'backends': backends, 'combos': [], 'count_mismatches': []}
+    baseline = {}
+    for backend in backends:
+        for scoped in (False, True):
+            total = 0.0
+            for page in pages:
+                key = (page['source'], page['kind'])
+                scope = page['scope'] if scoped else None
+                elapsed, count = timed_parse(page['text'], scope, backend, SELECTORS[key], args.repeat)
+                total += elapsed
+                # html.parser 전체 파싱(기존 크롤러 동작)을 기준으로 요소 수를 비교
+                expected = baseline.setdefault(key, count)
+                if count != expected:
+                    results['count_mismatches'].append({
+                        'source': page['source'], 'kind': page['kind'], 'backend': backend,
+                        'scoped': scoped, 'count': count, 'expected': expected,
+                    })
+            results['combos'].append({
+                'backend': backend,
+                'scoped': scoped,
+                'ms_per_page': round(total / len(pages) * 1000, 3),
+                'pages_per_sec': round(len(pages) / total, 1),
+            })
+
+    base_ms = results['combos'][0]['ms_per_page']
+    for combo in results['combos']:
+        combo['speedup'] = round(base_ms / combo['ms_per_page'], 2)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    print(f"pages: {results['pages']} ({', '.join(backends)})")
+    for c in results['combos']:
+        label = f"{c['backend']}{' + scope' if c['scoped'] else ''}"
+        print(f"{label:<22} {c['ms_per_page']:>8.2f} ms/page  {c['pages_per_sec']:>8.1f} pages/s  x{c['speedup']}")
+    print(f"count mismatches: {len(results['count_mismatches'])}")
+    for m in results['count_mismatches']:
+        print(f"  {m}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/fixture_adapter.py
+# benchmarks/fixtures 의 저장된 페이지를 돌려주는 requests 어댑터.
+# http_client 의 공유 세션에 끼우면 크롤러 코드를 고치지 않고 네트워크 없이 돌릴 수 있다.
+# manifest.json 의 pattern(정규식)에 맞는 첫 페이지를 돌려주고, 없으면 404.
+import json
+import os
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_manifest(fixture_dir=FIXTURE_DIR):
+    with open(os.path.join(fixture_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)['pages']
+
+
+class FixtureAdapter(BaseAdapter):
+    def __init__(self, fixture_dir=FIXTURE_DIR):
+        super().__init__()
+        self.routes = []
+        for page in load_manifest(fixture_dir):
+            with open(os.path.join(fixture_dir, page['file']), 'rb') as f:
+                body = f.read()
+            if page.get('templated'):
+                # 최근 N일만 받는 크롤러(Google)를 위해 날짜 자리를 오늘로 채운다
+                today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+                body = body.replace(b'{{TODAY}}', today.encode('ascii'))
+            self.routes.append((re.compile(page['pattern']), page, body))
+        self._lock = threading.Lock()
+        self.requests = Counter()  # (소스, 종류) -> 요청 수
+
+    def send(self, request, **kwargs):
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.headers = CaseInsensitiveDict()
+        for pattern, page, body in self.routes:
+            if pattern.search(request.url):
+                with self._lock:
+                    self.requests[(page['source'], page['kind'])] += 1
+                response.status_code = 200
+                response.reason = 'OK'
+                response.headers['Content-Type'] = f"text/html; charset={page.get('encoding', 'utf-8')}"
+                response._content = body
+                break
+        else:
+            with self._lock:
+                self.requests[('unmatched', 'unmatched')] += 1
+            response.status_code = 404
+            response.reason = 'Not Found'
+            response._content = b''
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self):
+        pass
+
+
+def install(session, fixture_dir=FIXTURE_DIR):
+    """session 의 http/https 요청을 모두 fixture 로 돌린다."""
+    adapter = FixtureAdapter(fixture_dir)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return adapter
@@ -0,0 +1,66 @@
+# benchmarks/record_fixtures.py
+# 실제 사이트에서 페이지를 받아 benchmarks/fixtures 에 저장하고 manifest.json 을 갱신한다.
+# 사이트 구조가 바뀌었을 때 fixture 를 새로 녹화하는 용도 (네트워크 필요).
+# 사용법: python benchmarks/record_fixtures.py <소스> <list|detail> <url> [--pattern 정규식] [--encoding euc-kr]
+import argparse
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import http_client  # noqa: E402
+from crawl_runner import SOURCES  # noqa: E402
+from fixture_adapter import FIXTURE_DIR  # noqa: E402
+
+
+def default_pattern(url):
+    # 같은 호스트 + 같은 첫 경로 요소면 이 fixture 로 응답
+    m = re.match(r'^(https?://[^/]+/[^/?]*)', url)
+    return '^' + re.escape(m.group(1) if m else url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='벤치마크용 fixture 녹화')
+    parser.add_argument('source', choices=list(SOURCES))
+    parser.add_argument('kind', choices=['list', 'detail'])
+    parser.add_argument('url')
+    parser.add_argument('--pattern', help='이 fixture 로 응답할 URL 정규식 (기본: 호스트 + 첫 경로)')
+    parser.add_argument('--encoding', default='utf-8', help='페이지 인코딩 (SkyDaily 는 euc-kr)')
+    args = parser.parse_args()
+
+    response = http_client.get(args.url)
+    response.raise_for_status()
+
+    relative = f'{args.source}/{args.kind}.html'
+    path = os.path.join(FIXTURE_DIR, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(response.content)
+
+    manifest_path = os.path.join(FIXTURE_DIR, 'manifest.json')
+    manifest = {'pages': []}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    pages = [page for page in manifest['pages']
+             if (page['source'], page['kind']) != (args.source, args.kind)]
+    pages.append({
+        'source': args.source,
+        'kind': args.kind,
+        'url': args.url,
+        'pattern': args.pattern or default_pattern(args.url),
+        'file': relative,
+        'encoding': args.encoding,
+    })
+    manifest['pages'] = pages
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"{args.url} -> {path} ({len(response.content):,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
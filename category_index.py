@@ -0,0 +1,156 @@
+# category_index.py
+# 카테고리별 기사 색인: 저장할 때 매칭된 News_keyword.json 카테고리마다 기사 한 줄씩 덧붙인다.
+#   news_json/categories/<소스 파일 이름>/<카테고리>.jsonl
+#   (한 줄 = {"source", "date", "day", "time", "title", "url", "keywords", "match_score", "keyword_version"})
+# "무기 나 재난별 기사만" 같은 조회를 기사 본문을 다시 매칭하지 않고 그 카테고리 파일만 읽어서 한다.
+# 소스마다 폴더가 따로라 소스별 워크플로가 같은 파일을 건드리지 않는다.
+# 사용법: python category_index.py build [naver daum ...]
+#         python category_index.py list 무기 재난별 [--source naver] [--since 2025-04-01] [--until ...]
+#         python category_index.py stats
+import argparse
+import glob
+import importlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+from collections import Counter
+
+from article_store import NEWS_JSON_DIR, shard_key
+from keyword_matcher import article_match_fields
+
+CATEGORY_ROOT = os.path.join(NEWS_JSON_DIR, 'categories')
+
+_lock = threading.Lock()
+
+
+def category_filename(category):
+    """'User Added' -> 'User_Added.jsonl'. 파일 이름에 못 쓰는 글자만 바꾼다."""
+    return (re.sub(r'[^\w-]+', '_', category).strip('_') or 'uncategorized') + '.jsonl'
+
+
+def _entries(source, date_label, articles):
+    """{카테고리: [줄, ...]} 로 나눈다."""
+    day = shard_key(date_label)
+    by_category = {}
+    for article in articles:
+        fields = article_match_fields(article)
+        line = json.dumps({
+            'source': source,
+            'date': date_label,
+            'day': day,
+            'time': article.get('time') or '',
+            'title': article.get('title') or '',
+            'url': article['url'],
+            'keywords': fields['keywords'],
+            'match_score': fields['match_score'],
+            'keyword_version': fields['keyword_version'],
+        }, ensure_ascii=False) + '\n'
+        for category in fields['categories']:
+            by_category.setdefault(category, []).append(line)
+    return by_category
+
+
+def _write(directory, by_category):
+    os.makedirs(directory, exist_ok=True)
+    for category, lines in by_category.items():
+        with open(os.path.join(directory, category_filename(category)), 'a', encoding='utf-8') as f:
+            f.write(''.join(lines))
+
+
+def add(source, store_name, date_label, articles, root=CATEGORY_ROOT):
+    """새로 저장한 기사들을 매칭된 카테고리 파일마다 덧붙인다. 덧붙인 줄 수를 돌려준다."""
+    by_category = _entries(source, date_label, articles)
+    with _lock:
+        _write(os.path.join(root, store_name), by_category)
+    return sum(len(lines) for lines in by_category.values())
+
+
+def rebuild(source, store, root=CATEGORY_ROOT):
+    """소스의 샤드 전체에서 그 소스 색인을 다시 만든다. 저장된 매칭 결과가 없는 예전 기사는 다시 매칭한다."""
+    directory = os.path.join(root, store.name)
+    tmp_dir = os.path.join(root, f'.tmp-{store.name}')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    count = 0
+    for date_label, articles in store.iter_days():
+        by_category = _entries(source, date_label, articles)
+        _write(tmp_dir, by_category)
+        count += sum(len(lines) for lines in by_category.values())
+    with _lock:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_dir, directory)
+    return count
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def iter_category(categories, sources=None, since=None, until=None, root=CATEGORY_ROOT):
+    """카테고리(하나 또는 여러 개) 에 속한 기사 항목을 돌려준다. 여러 카테고리에 걸친 기사는 한 번만.
+    sources: ['naver', ...] (crawl_runner 의 이름), since/until: 'YYYY-MM-DD' (양쪽 포함)."""
+    if isinstance(categories, str):
+        categories = [categories]
+    seen = set()
+    for category in categories:
+        for path in sorted(glob.glob(os.path.join(root, '*', category_filename(category)))):
+            for entry in _read(path):
+                if sources and entry['source'] not in sources:
+                    continue
+                if (since and entry['day'] < since) or (until and entry['day'] > until):
+                    continue
+                if entry['url'] in seen:
+                    continue
+                seen.add(entry['url'])
+                yield entry
+
+
+def stats(root=CATEGORY_ROOT):
+    """{카테고리 파일 이름: 줄 수}"""
+    counts = Counter()
+    for path in glob.glob(os.path.join(root, '*', '*.jsonl')):
+        with open(path, 'r', encoding='utf-8') as f:
+            counts[os.path.basename(path)[:-len('.jsonl')]] += sum(1 for line in f if line.strip())
+    return counts
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='카테고리별 기사 색인 (news_json/categories)')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_parser = sub.add_parser('build', help='샤드에서 색인을 다시 만든다')
+    build_parser.add_argument('sources', nargs='*')
+    list_parser = sub.add_parser('list', help='카테고리에 속한 기사 출력 (JSON Lines)')
+    list_parser.add_argument('categories', nargs='+')
+    list_parser.add_argument('--source', action='append')
+    list_parser.add_argument('--since', help='YYYY-MM-DD')
+    list_parser.add_argument('--until', help='YYYY-MM-DD')
+    sub.add_parser('stats', help='카테고리별 기사 수')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        from crawl_runner import SOURCES
+        for name in args.sources or SOURCES:
+            crawler = importlib.import_module(SOURCES[name]).crawler
+            print(f"{name}: {rebuild(crawler.source, crawler.store)}줄 -> {CATEGORY_ROOT}/{crawler.store.name}")
+    elif args.command == 'list':
+        for entry in iter_category(args.categories, args.source, args.since, args.until):
+            sys.stdout.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    else:
+        for category, count in stats().most_common():
+            print(f"{count:6d}  {category}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
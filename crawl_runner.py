@@ -0,0 +1,201 @@
+# crawl_runner.py
+# 모든 소스를 한 프로세스, 하나의 asyncio 이벤트 루프에서 동시에 돌린다.
+# 각 크롤러의 main() 이 끝나면 news_json/ 아래 같은 파일을 샤드에서 다시 만든다.
+# --daemon 이면 끝나지 않고 소스마다 자기 주기로 계속 돌린다. import, 키워드 매처, HTTP 세션,
+# URL/기사 인덱스 연결이 살아 있으므로 회차마다 드는 것은 네트워크 요청 정도다.
+# 소스별 마지막 실행 시각은 STATE_DIR 에 남겨서 다시 띄워도 주기를 이어 간다.
+# 사용법: python crawl_runner.py [naver daum ...] [--host-limit 4] [--profile]
+#         python crawl_runner.py --daemon [--interval 30] [--every naver=10 --every google=60]
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import http_client
+import profiling
+from article_store import ArticleStore, NEWS_JSON_DIR
+from url_index import STATE_DIR
+
+# 소스 이름 -> 크롤러 모듈
+SOURCES = {
+    'google': 'Google_Crawler',
+    'naver': 'Naver_Crawler',
+    'daum': 'Daum_crawler',
+    'yna': 'YNA_Crawler',
+    'nate': 'Nate_Crawler',
+    'skydaily': 'SkyDaily_Crawler',
+    'voa': 'VOA_Crawler',
+    'fnnews': 'FnNews_Crawler',
+    'fntoday': 'FNToday_Crawler',
+    'gukje': 'Gukje_Crawler',
+}
+
+# 소스 이름 -> news_json 아래 예전 형식 파일 이름 (각 어댑터의 result_filename).
+# 다른 소스의 샤드를 읽을 때 크롤러 모듈(과 모듈마다 만드는 크롤러, 상태 파일)을 import 하지 않으려고 따로 둔다
+RESULT_FILES = {
+    'google': 'google_News.json',
+    'naver': 'naver_News.json',
+    'daum': 'daum_News.json',
+    'yna': 'yna_News.json',
+    'nate': 'nate_News.json',
+    'skydaily': 'skyDaily_News.json',
+    'voa': 'voa_News.json',
+    'fnnews': 'Fn_News.json',
+    'fntoday': 'fntoday_News.json',
+    'gukje': 'Gukje_News.json',
+}
+
+DEFAULT_HOST_LIMIT = 4
+DEFAULT_INTERVAL = 30  # 분 (소스별 GitHub Actions 워크플로와 같은 주기)
+SCHEDULE_PATH = os.path.join(STATE_DIR, 'daemon_schedule.json')
+
+
+def source_stores(names=None):
+    """{소스 이름: ArticleStore}. 크롤러 모듈은 import 하지 않는다."""
+    return {name: ArticleStore(os.path.join(NEWS_JSON_DIR, RESULT_FILES[name])) for name in names or SOURCES}
+
+
+async def run_source(loop, executor, name):
+    start = time.perf_counter()
+    try:
+        module = importlib.import_module(SOURCES[name])
+        # 크롤러 코드는 동기식이라 스레드에서 돌리고, 소스끼리는 루프에서 동시에 진행한다
+        await loop.run_in_executor(executor, module.main)
+        # 샤드에 쌓인 기사로 예전 형식 파일(news_json/*.json)을 다시 만든다 (새 기사가 없으면 그대로 둔다)
+        if module.crawler.needs_materialize():
+            await loop.run_in_executor(executor, module.store.materialize)
+        status = 'ok'
+    except Exception as e:
+        print(f"[{name}] 크롤링 실패: {e}")
+        status = 'failed'
+    elapsed = time.perf_counter() - start
+    print(f"[{name}] 완료 ({status}, {elapsed:.1f}s)")
+    return name, status, elapsed
+
+
+async def run_all(names, host_limit=DEFAULT_HOST_LIMIT):
+    http_client.set_host_limit(host_limit)
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix='source') as executor:
+        results = await asyncio.gather(*(run_source(loop, executor, name) for name in names))
+    http_client.close()
+    return results
+
+
+def load_schedule(path=SCHEDULE_PATH):
+    """{소스: 마지막 실행 시작 시각(epoch 초)}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_schedule(schedule, path=SCHEDULE_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(schedule, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+async def run_periodically(loop, executor, name, interval, schedule, stop):
+    """소스 하나를 interval 초마다 돌린다. 한 번 실행이 주기보다 길어지면 밀린 회차는 건너뛴다."""
+    next_at = schedule.get(name, 0) + interval
+    while not stop.is_set():
+        delay = next_at - time.time()
+        if delay > 0:
+            try:
+                await asyncio.wait_for(stop.wait(), delay)
+                break
+            except asyncio.TimeoutError:
+                pass
+        started = time.time()
+        await run_source(loop, executor, name)
+        # 끝난 실행만 기록한다 (도중에 멈췄으면 다시 띄울 때 바로 돈다)
+        schedule[name] = started
+        save_schedule(schedule)
+        next_at = started + interval
+        while next_at <= time.time():
+            next_at += interval
+        print(f"[{name}] 다음 실행 {time.strftime('%H:%M:%S', time.localtime(next_at))}")
+
+
+async def run_daemon(names, intervals, host_limit=DEFAULT_HOST_LIMIT):
+    http_client.set_host_limit(host_limit)
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+
+    def request_stop(sig):
+        print(f"{signal.Signals(sig).name} 받음: 진행 중인 실행이 끝나면 종료 (한 번 더 누르면 바로 종료)")
+        for handled in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(handled)
+        stop.set()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, request_stop, sig)
+    schedule = load_schedule()
+    print("데몬 시작: " + ', '.join(f"{name} {intervals[name] / 60:g}분" for name in names))
+    with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix='source') as executor:
+        await asyncio.gather(*(run_periodically(loop, executor, name, intervals[name], schedule, stop)
+                               for name in names))
+    http_client.close()
+
+
+def parse_intervals(parser, names, default, overrides):
+    """--interval (분) 과 --every 소스=분 으로 소스별 주기(초)를 만든다."""
+    intervals = dict.fromkeys(names, default * 60)
+    for override in overrides or ():
+        name, _, minutes = override.partition('=')
+        if name not in SOURCES:
+            parser.error(f"알 수 없는 소스: {name}")
+        try:
+            intervals[name] = float(minutes) * 60
+        except ValueError:
+            parser.error(f"--every 는 소스=분 형식이어야 합니다: {override}")
+        if intervals[name] <= 0:
+            parser.error(f"주기는 0보다 커야 합니다: {override}")
+    return intervals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모든 뉴스 소스를 한 프로세스에서 동시에 크롤링')
+    parser.add_argument('sources', nargs='*', help=f"실행할 소스 (생략하면 전체): {', '.join(SOURCES)}")
+    parser.add_argument('--host-limit', type=int, default=DEFAULT_HOST_LIMIT,
+                        help='호스트별 동시 요청 수 상한')
+    parser.add_argument('--daemon', action='store_true', help='끝나지 않고 소스마다 주기적으로 계속 실행')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f'--daemon 의 기본 실행 주기 (분, 기본 {DEFAULT_INTERVAL})')
+    parser.add_argument('--every', action='append', metavar='SOURCE=MIN', help='소스별 실행 주기 (분)')
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    names = args.sources or list(SOURCES)
+    unknown = [name for name in names if name not in SOURCES]
+    if unknown:
+        parser.error(f"알 수 없는 소스: {', '.join(unknown)}")
+
+    if args.daemon:
+        if args.interval <= 0:
+            parser.error("--interval 은 0보다 커야 합니다")
+        intervals = parse_intervals(parser, names, args.interval, args.every)
+        with profiling.maybe_profiled(args, 'crawl_runner'):
+            asyncio.run(run_daemon(names, intervals, args.host_limit))
+        return
+
+    start = time.perf_counter()
+    with profiling.maybe_profiled(args, 'crawl_runner'):
+        results = asyncio.run(run_all(names, args.host_limit))
+    total = time.perf_counter() - start
+
+    print("\n--- 소스별 소요 시간 ---")
+    for name, status, elapsed in sorted(results, key=lambda r: r[2], reverse=True):
+        print(f"{name:<10} {status:<7} {elapsed:6.1f}s")
+    print(f"전체: {total:.1f}s (순차 실행 시 합계 {sum(r[2] for r in results):.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
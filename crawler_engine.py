@@ -0,0 +1,661 @@
+# crawler_engine.py
+# 모든 소스가 같이 쓰는 크롤링 엔진.
+# 목록 페이지 받기 -> 파싱 -> 관련성 필터 -> 상세 페이지 -> 샤드 저장 흐름은 여기 한 곳에 있고,
+# 각 *_Crawler.py 는 SiteCrawler 를 상속해 URL, 선택자, 시간 형식, 상세 페이지 규칙만 적는다.
+# 키워드 자동자(get_matcher, 파일이 바뀌면 실행 시작 때 새로 컴파일), HTTP 세션(http_client), 캐시들은 프로세스에 하나씩만 만들어진다.
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin, urlparse, urlunparse
+
+import category_index
+import detail_cache
+import fetch_policy
+import html_parser
+import http_cache
+import http_client
+import profiling
+import rate_limiter
+import run_report
+import search_index
+import story_index
+import watermark_store
+from article_store import ArticleStore, NEWS_JSON_DIR
+from keyword_matcher import get_matcher, match_fields
+from singleflight import ClaimRegistry
+from url_index import SeenLinks, open_index
+
+try:
+    import parquet_archive
+except ImportError:  # pyarrow 가 없으면 Parquet 아카이브 없이 돈다
+    parquet_archive = None
+
+DAY_MAP = {
+    'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일', 'Thursday': '목요일',
+    'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
+}
+
+
+def today_label(dt=None):
+    """'2025년 04월 18일 금요일' 형식의 날짜 라벨 (요일은 한국어)."""
+    dt = dt or datetime.now()
+    eng_day = dt.strftime('%A')
+    return dt.strftime(f'%Y년 %m월 %d일 {DAY_MAP.get(eng_day, eng_day)}')
+
+
+def element_value(element, attr=None):
+    """선택자로 찾은 요소에서 값을 꺼낸다. attr 가 'html' 이면 <br> 을 줄바꿈으로 바꾼 내부 HTML."""
+    if attr is None:
+        return element.get_text().strip()
+    if attr == 'html':
+        return element.decode_contents().replace('<br>', '\n').replace('<br/>', '\n').strip()
+    return (element.get(attr) or '').strip()
+
+
+RELEVANCE_POLICIES = ('lossless', 'always', 'hint', 'title')
+
+
+def resolve_relevance_policy(policy):
+    """CRAWLER_RELEVANCE_POLICY 를 반영하고 정책 이름을 검사한다. 모르는 이름이면 ValueError."""
+    policy = os.environ.get('CRAWLER_RELEVANCE_POLICY') or policy
+    if policy not in RELEVANCE_POLICIES:
+        raise ValueError(f"알 수 없는 관련성 정책: {policy!r} (가능한 값: {', '.join(RELEVANCE_POLICIES)})")
+    return policy
+
+
+def run_cli(crawler, argv=None):
+    """각 *_Crawler.py 를 직접 실행할 때의 진입점. python Naver_Crawler.py [--profile]"""
+    parser = argparse.ArgumentParser(description=f'{crawler.source} 뉴스 크롤러')
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    with profiling.maybe_profiled(args, crawler.source):
+        crawler.run()
+    # GitHub Actions 에서는 다음 단계(예전 형식 파일 만들기)를 거를 수 있게 step output 으로 남긴다
+    output = os.environ.get('GITHUB_OUTPUT')
+    if output:
+        with open(output, 'a', encoding='utf-8') as f:
+            f.write(f"saved={crawler.metrics.counters['saved']}\n")
+            f.write(f"materialize={'true' if crawler.needs_materialize() else 'false'}\n")
+
+
+class SiteCrawler:
+    # --- 사이트마다 적는 값 ---
+    source = None            # 'naver' 등 (상세 캐시 네임스페이스)
+    result_filename = None   # news_json 아래 예전 형식 파일 이름
+    urls = []                # 섹션(목록) URL
+    list_scope = None        # html_parser.parse 의 scope
+    item_selector = None     # 기사 하나에 해당하는 요소
+    title_selector = None    # None 이면 요소 자체
+    link_selector = None     # None 이면 제목 요소나 요소 자체 중 <a>
+    time_selector = None
+    img_selector = None
+    lead_selector = None     # 목록에 있는 요약 (관련성 판단에도 씀)
+    time_formats = ()        # strptime 형식. 연도가 없는 형식은 올해로 채운다
+    time_required = True     # 시간 요소가 없으면 버릴지
+    strip_query = False      # 기사 URL 의 쿼리스트링 제거
+    encoding = None          # 응답 인코딩을 강제할 때 ('euc-kr')
+
+    # 관련성: 포함 키워드 min_keywords 개 이상 + 제외 키워드 없음
+    include_mode = 'substring'   # 'substring' | 'word'
+    exclude_mode = None          # None | 'substring' | 'word'
+    min_keywords = 2
+    dedupe_titles = False        # 같은 제목을 한 번만 받기
+    # detail_for_relevance 인 소스에서 상세 페이지를 받기 전에 제목만으로 거르는 정책
+    #   'lossless': 제목에 제외 키워드가 있으면 상세를 받지 않고 버린다. 결과는 'always' 와 같다 (기본값)
+    #   'always':   제목 단계 없이 언제나 상세까지 받아서 판단 (비교용)
+    #   'hint':     제목에 포함 키워드가 title_hint_keywords 개 이상일 때만 상세를 받는다
+    #   'title':    제목만으로 판단하고 상세는 통과한 기사만 받는다
+    # 'hint'/'title' 은 키워드가 요약에만 있는 기사를 놓칠 수 있으니 재현율을 확인한 어댑터만 켠다.
+    # CRAWLER_RELEVANCE_POLICY 가 있으면 모든 소스의 정책을 그 값으로 바꾼다 (벤치마크 비교용)
+    relevance_policy = 'lossless'
+    title_hint_keywords = 1
+
+    # 상세 페이지: {필드: [(선택자, 속성), ...]} - 앞에서부터 처음 찾은 값을 쓴다
+    detail_rules = None
+    detail_scope = None
+    detail_time_formats = ()
+    detail_for_relevance = False  # 상세 요약까지 합쳐서 관련성을 볼지 (그러면 상세를 먼저 받는다)
+    detail_required = None        # 상세에서 이 필드를 못 얻으면 버림
+    store_summary = False         # 저장하는 기사에 summary 필드를 넣을지
+
+    max_workers = 5
+    max_pages = 1
+    # 목록 호스트로 가는 요청 속도 (초당 요청 수, None 이면 제한 없음). 같은 호스트의 상세 페이지에도 적용된다
+    request_rate = None
+    request_burst = 1
+    request_jitter = 0.0     # 요청마다 0~jitter 초를 더 기다린다
+    use_watermark = False    # 섹션별 워터마크에 닿으면 페이지 넘김을 멈춤 (최신순 목록에서만)
+    # 이 이유로 버린 기사가 있는 목록 페이지는 다음 실행에서 다시 본다 (일시적인 실패)
+    retry_reasons = ('detail_missing', 'error')
+
+    def __init__(self):
+        self.store = ArticleStore(os.path.join(NEWS_JSON_DIR, self.result_filename))
+        self.relevance_policy = resolve_relevance_policy(self.relevance_policy)
+        self.matcher = get_matcher()
+        self.processed_links = set()
+        self.complete_pages = []
+        self.retry_pages = []
+        self.legacy_missing = False
+        self.url_index = None
+        self.seen_titles = set()
+        self.claims = ClaimRegistry()
+        self.metrics = run_report.RunMetrics(self.source)
+        self.stories = story_index.get_index()
+        self.watermarks = watermark_store.get_store()
+        self.today = today_label()
+        if self.detail_rules:
+            self.fetch_detail = detail_cache.cached(f'{self.source}:detail',
+                                                    required=self.detail_required)(self.extract_detail)
+
+    # --- 목록 페이지 순회 ---
+
+    def section_urls(self):
+        return self.urls
+
+    def page_url(self, url, page):
+        return url
+
+    def list_request_kwargs(self):
+        return {}
+
+    def decode(self, response):
+        if self.encoding:
+            response.encoding = self.encoding
+        return response.text
+
+    def select_items(self, soup, list_url):
+        return soup.select(self.item_selector)
+
+    def scrape_page(self, url):
+        """목록 페이지 하나를 처리해 새 기사 목록을 돌려준다."""
+        return self.scrape_list(url)[0]
+
+    def scrape_list(self, url, watermark=None, section=None):
+        """목록 페이지 하나를 처리해 (새 기사 목록, 맨 위 항목, 워터마크에 닿았는지) 를 돌려준다.
+        상세 페이지 실패 등으로 다 처리하지 못한 페이지는 맨 위 항목을 None 으로 돌려주고 조건부 GET 검증값도 버려서
+        다음 실행에서 워터마크나 '변경 없음' 때문에 건너뛰지 않게 한다."""
+        print(f"Scraping URL: {url}")
+        section = section or url
+        try:
+            with self.metrics.stage('list_fetch'):
+                response = http_cache.get_if_changed(url, **self.list_request_kwargs())
+            self.metrics.count('list_requests', section=section)
+            if response is None:
+                print(f"변경 없음, 건너뜀: {url}")
+                self.metrics.count('list_not_modified', section=section)
+                return [], None, False
+            response.raise_for_status()
+            self.metrics.count('list_bytes', len(response.content), section=section)
+            with self.metrics.stage('parse'):
+                soup = html_parser.parse(self.decode(response), self.list_scope)
+                elements = self.select_items(soup, url)
+                print(f"Found {len(elements)} articles")
+                items = self.parse_items(elements, url)
+            top = items[0] if items else None
+            crossed = False
+            if watermark:
+                items, crossed = self.cut_at_watermark(items, watermark)
+                if crossed:
+                    print(f"워터마크 도달: 새 항목 {len(items)}개 ({url})")
+            self.metrics.count('items', len(items), section=section)
+            for item in items:
+                item['section'] = section
+            if self.max_workers > 1 and len(items) > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = list(executor.map(lambda item: self.process_item(item, url), items))
+            else:
+                results = [self.process_item(item, url) for item in items]
+            if any(item.get('reject_reason') in self.retry_reasons for item in items):
+                print(f"다 처리하지 못한 기사가 있어 다음 실행에서 다시 봄: {url}")
+                http_cache.discard(url)
+                self.retry_pages.append(url)
+                top = None
+            else:
+                self.complete_pages.append(url)
+            return [article for article in results if article], top, crossed
+        except Exception as e:
+            print(f"페이지 처리 실패 ({url}): {e}")
+            http_cache.discard(url)
+            self.retry_pages.append(url)
+            return [], None, False
+
+    def parse_items(self, elements, list_url):
+        items = []
+        for element in elements:
+            try:
+                item = self.parse_item(element, list_url)
+            except Exception as e:
+                print(f"기사 파싱 실패 ({list_url}): {e}")
+                continue
+            if item:
+                items.append(item)
+        return items
+
+    def cut_at_watermark(self, items, watermark):
+        """목록(최신순)에서 지난 실행의 맨 위 기사나 그보다 오래된 기사가 나오기 전까지만 남긴다."""
+        for i, item in enumerate(items):
+            if detail_cache.normalize_url(item['url']) == watermark['url']:
+                return items[:i], True
+            if watermark['time'] and item['time'] and item['time'] < watermark['time']:
+                return items[:i], True
+        return items, False
+
+    # --- 기사 하나 ---
+
+    def parse_time(self, text, formats=None):
+        now = datetime.now()
+        for fmt in formats or self.time_formats:
+            if '%d' in fmt and '%Y' not in fmt and '%y' not in fmt:
+                # 연도가 없으면 올해를 붙여서 파싱한다 (strptime 은 1900년으로 보므로 2월 29일이 안 된다)
+                text_with_year, fmt = f'{now.year} {text}', f'%Y {fmt}'
+            else:
+                text_with_year = text
+            try:
+                dt = datetime.strptime(text_with_year, fmt)
+            except ValueError:
+                continue
+            if '%d' not in fmt:
+                # 시:분 만 있으면 오늘 날짜
+                dt = datetime.combine(now.date(), dt.time())
+            return dt
+        return None
+
+    def format_time(self, dt):
+        return dt.isoformat()
+
+    def title_text(self, element):
+        title_element = element.select_one(self.title_selector) if self.title_selector else element
+        return title_element.get_text().strip() if title_element is not None else ''
+
+    def link_href(self, element):
+        if self.link_selector:
+            link_element = element.select_one(self.link_selector)
+        else:
+            # 제목 요소가 <a> 면 그것, 아니면 요소 자체
+            title_element = element.select_one(self.title_selector) if self.title_selector else None
+            link_element = title_element if title_element is not None and title_element.name == 'a' else element
+        return link_element.get('href') if link_element is not None else None
+
+    def time_text(self, element):
+        time_element = element.select_one(self.time_selector)
+        return time_element.get_text().strip() if time_element else None
+
+    def clean_url(self, url):
+        if not self.strip_query:
+            return url
+        parts = urlparse(url)
+        return urlunparse((parts.scheme, parts.netloc, parts.path, '', '', ''))
+
+    def parse_item(self, element, list_url):
+        """목록의 요소 하나에서 {title, url, time, img, summary} 를 뽑는다. 쓸 수 없으면 None."""
+        title = self.title_text(element)
+        href = self.link_href(element)
+        if not title or not href:
+            return None
+
+        formatted_time = ''
+        if self.time_selector:
+            text = self.time_text(element)
+            if text is None:
+                if self.time_required:
+                    return None
+            else:
+                dt = self.parse_time(text)
+                if dt is None:
+                    print(f"Invalid time format: {text}")
+                    return None
+                formatted_time = self.format_time(dt)
+
+        img_url = ''
+        if self.img_selector:
+            img_element = element.select_one(self.img_selector)
+            src = img_element.get('src') if img_element is not None else ''
+            img_url = urljoin(list_url, src) if src else ''
+
+        summary = ''
+        if self.lead_selector:
+            lead_element = element.select_one(self.lead_selector)
+            summary = lead_element.get_text().strip() if lead_element else ''
+
+        return {
+            'title': title,
+            'url': self.clean_url(urljoin(list_url, href)),
+            'time': formatted_time,
+            'img': img_url,
+            'summary': summary,
+        }
+
+    def extract_detail(self, url):
+        """detail_rules 대로 상세 페이지에서 필드를 뽑는다 (fetch_detail 로 캐시를 거쳐 호출)."""
+        try:
+            response = http_client.get(url)
+            self.metrics.count('detail_requests')
+            response.raise_for_status()
+            self.metrics.count('detail_bytes', len(response.content))
+            soup = html_parser.parse(self.decode(response), self.detail_scope)
+        except Exception as e:
+            print(f"데이터 추출 실패 ({url}): {e}")
+            return {}
+        detail = {}
+        for field, rules in self.detail_rules.items():
+            detail[field] = ''
+            for selector, attr in rules:
+                element = soup.select_one(selector)
+                if element is not None:
+                    detail[field] = element_value(element, attr)
+                    if detail[field]:
+                        break
+        return detail
+
+    def merge_detail(self, item, detail):
+        if detail.get('summary'):
+            item['summary'] = detail['summary']
+        if detail.get('img'):
+            item['img'] = urljoin(item['url'], detail['img'])
+        if detail.get('time'):
+            dt = self.parse_time(detail['time'], self.detail_time_formats)
+            if dt is None:
+                print(f"Invalid time format: {detail['time']}")
+                return False
+            item['time'] = self.format_time(dt)
+        return not self.detail_required or bool(detail.get(self.detail_required))
+
+    def merge_story(self, item, story):
+        """다른 소스가 이미 받은 같은 기사의 시간/이미지로 상세 페이지를 대신한다. 모자라면 False."""
+        if not item['img'] and story['img']:
+            item['img'] = story['img']
+        if not item['time'] and story['time']:
+            try:
+                item['time'] = self.format_time(datetime.fromisoformat(story['time']))
+            except ValueError:
+                pass
+        if self.detail_required == 'summary':
+            return bool(item['summary'] or story['summary'])
+        return not self.detail_required or bool(item.get(self.detail_required))
+
+    def load_detail(self, item):
+        story = item.get('story')
+        if story and self.merge_story(item, story):
+            self.metrics.count('story_reused')
+            item['story_reused'] = True
+            return True
+        with self.metrics.stage('detail_fetch'):
+            detail = self.fetch_detail(item['url'])
+        self.metrics.count('detail_lookups')
+        return self.merge_detail(item, detail)
+
+    def is_relevant(self, text):
+        return self.judge(self.matcher.match(text))
+
+    def judge(self, result):
+        """매칭 결과로 관련성을 판단한다: 포함 키워드 min_keywords 개 이상 + 제외 키워드 없음."""
+        if result.include_count(whole_word=self.include_mode == 'word') < self.min_keywords:
+            return False
+        if self.exclude_mode and result.has_exclude(whole_word=self.exclude_mode == 'word'):
+            return False
+        return True
+
+    def title_verdict(self, result):
+        """1단계: 제목의 매칭 결과만 본다. True(통과) / False(상세를 봐도 가망 없음) / None(상세 요약까지 봐야 함)."""
+        if self.relevance_policy == 'always':
+            return None
+        # 제목에 있는 제외 키워드는 요약을 붙여도 그대로라 어느 정책이든 여기서 끝난다
+        if self.exclude_mode and result.has_exclude(whole_word=self.exclude_mode == 'word'):
+            return False
+        if self.relevance_policy == 'lossless':
+            return None
+        count = result.include_count(whole_word=self.include_mode == 'word')
+        if count >= self.min_keywords:
+            # 제외 키워드는 요약에도 있을 수 있으니 그때는 상세까지 본다
+            return True if not self.exclude_mode or self.relevance_policy == 'title' else None
+        if self.relevance_policy == 'title' or count < self.title_hint_keywords:
+            return False
+        return None
+
+    def relevance_text(self, item, fallback_summary=''):
+        summary = item['summary'] or fallback_summary
+        return f"{item['title']} {summary}" if summary else item['title']
+
+    def accept(self, item):
+        """모든 검사를 통과한 기사를 마지막으로 거를 때 쓰는 훅 (Google 의 유사 제목 등)."""
+        return True
+
+    def check_item(self, item):
+        """기사 하나를 거른다. 버리는 이유('seen', 'irrelevant' 등)를 돌려주고, 통과하면 None."""
+        with self.metrics.stage('dedupe'):
+            if item['url'] in self.processed_links:
+                return 'seen'
+            # 같은 링크가 한 페이지에 두 번, 또는 겹치는 섹션에 나와도 먼저 차지한 작업자만 처리한다
+            if not self.claims.claim(detail_cache.normalize_url(item['url'])):
+                return 'duplicate_url'
+            if self.dedupe_titles and item['title'] in self.seen_titles:
+                return 'duplicate_title'
+            # 다른 소스가 이미 받은 기사면 그 기록과 연결하고 상세 페이지 요청을 건너뛴다
+            item['story'] = self.stories.find(item['title'], item['url'], exclude_source=self.source)
+            self.metrics.count('story_lookups')
+            if item['story']:
+                self.metrics.count('story_linked')
+        needs_detail = bool(self.detail_rules)
+        if needs_detail and self.detail_for_relevance:
+            # 2단계 필터: 제목에서 가망 없는 기사는 상세 페이지를 받지 않는다
+            with self.metrics.stage('relevance'):
+                result = self.matcher.match(item['title'])
+                verdict = self.title_verdict(result)
+            if verdict is False:
+                self.metrics.count('detail_avoided')
+                return 'title_stage'
+            if verdict is None:
+                if not self.load_detail(item):
+                    return 'detail_missing'
+                # 상세 대신 연결된 기사를 썼으면 요약을 따로 저장하지 않지만 판단에는 먼저 받은 소스의 요약을 쓴다
+                story_summary = item['story']['summary'] if item.get('story_reused') else ''
+                with self.metrics.stage('relevance'):
+                    result = self.matcher.match(self.relevance_text(item, story_summary))
+                    relevant = self.judge(result)
+                if not relevant:
+                    return 'irrelevant'
+                needs_detail = False
+        else:
+            with self.metrics.stage('relevance'):
+                result = self.matcher.match(self.relevance_text(item))
+                relevant = self.judge(result)
+            if not relevant:
+                return 'irrelevant'
+        item['match'] = result
+        if needs_detail and not self.load_detail(item):
+            return 'detail_missing'
+        with self.metrics.stage('dedupe'):
+            if not self.accept(item):
+                return 'accept_hook'
+        return None
+
+    def process_item(self, item, list_url):
+        section = item.get('section', list_url)
+        try:
+            reason = self.check_item(item)
+        except Exception as e:
+            print(f"기사 처리 실패 ({list_url}): {e}")
+            reason = 'error'
+        if reason:
+            item['reject_reason'] = reason
+            self.metrics.count('rejected', section=section)
+            self.metrics.count(f'rejected:{reason}', section=section)
+            return None
+
+        self.metrics.count('accepted', section=section)
+        self.processed_links.add(item['url'])
+        self.seen_titles.add(item['title'])
+        story = item['story']
+        item['story_id'] = self.stories.record(self.source, item, story['story_id'] if story else None)
+        print(f"Article processed: {item['title']} ({item['time']})")
+        return self.to_article(item)
+
+    def to_article(self, item):
+        article = {
+            'title': item['title'],
+            'time': item['time'],
+            'img': item['img'],
+            'url': item['url'],
+            'original_url': item['url'],
+            'story_id': item['story_id'],
+        }
+        article.update(match_fields(item['match'], whole_word=self.include_mode == 'word'))
+        if item['story']:
+            article['linked_to'] = {'source': item['story']['source'], 'url': item['story']['url']}
+        if self.store_summary:
+            article['summary'] = item['summary']
+        return article
+
+    # --- 실행 ---
+
+    def start_run(self, persistent=True):
+        """실행 상태 초기화. persistent=False 면 URL/기사 인덱스 대신 메모리에만 둔다 (벤치마크용)."""
+        self.today = today_label()
+        # save() 가 빈 파일을 만들어 두므로 실행 전에 봐 둔다 (needs_materialize)
+        self.legacy_missing = not os.path.exists(self.store.legacy_filename)
+        # 키워드 파일이 바뀌었으면 여기서 새 매처로 바뀐다. 한 실행 안에서는 같은 버전을 쓴다
+        self.matcher = get_matcher()
+        if persistent and self.url_index is None:
+            # 한 프로세스에서 여러 번 실행해도 (crawl_runner --daemon) 인덱스 연결은 하나만 연다
+            self.url_index = open_index(self.store)
+        self.processed_links = SeenLinks(self.url_index) if persistent else set()
+        self.seen_titles = set()
+        self.complete_pages = []
+        self.retry_pages = []
+        self.claims = ClaimRegistry()
+        self.metrics = run_report.RunMetrics(self.source)
+        # 호스트별 통계는 프로세스 누적이라 (crawl_runner, --daemon) 이번 실행 몫만 보이도록 시작 값을 둔다
+        self.stat_marks = {'http_cache': http_cache.snapshot(), 'rate_limiter': rate_limiter.snapshot(),
+                           'fetch_policy': fetch_policy.snapshot()}
+        self.stories = story_index.get_index() if persistent else story_index.StoryIndex(':memory:')
+        if persistent:
+            self.sync_stories()
+        self.watermarks = watermark_store.get_store() if persistent else watermark_store.WatermarkStore(':memory:')
+
+    def sync_stories(self):
+        """다른 소스가 (다른 워크플로에서) 커밋한 최근 기사를 스토리 인덱스에 넣어 둔다."""
+        from crawl_runner import source_stores  # crawl_runner 는 크롤러(이 모듈)를 돌리는 쪽이라 여기서 import
+        try:
+            added = self.stories.sync(source_stores())
+        except Exception as e:
+            print(f"스토리 인덱스 동기화 실패: {e}")
+            return
+        if added:
+            print(f"[story_index] 샤드에서 최근 기사 {added}개를 가져옴")
+
+    def needs_materialize(self):
+        """예전 형식 파일을 샤드에서 다시 만들어야 하는지: 이번 실행에서 저장한 기사가 있거나 실행 전에 파일이 없었을 때."""
+        return bool(self.metrics.counters['saved']) or self.legacy_missing
+
+    def date_label(self, article):
+        return self.today
+
+    def save(self, articles):
+        # 최신 기사가 먼저 오도록 정렬해 날짜별 샤드에 덧붙인다
+        articles = sorted(articles, key=lambda article: article.get('time', ''), reverse=True)
+        by_label = {}
+        for article in articles:
+            by_label.setdefault(self.date_label(article), []).append(article)
+        added = 0
+        try:
+            for label, group in by_label.items():
+                new_articles = self.store.append(label, group)
+                added += len(new_articles)
+                self.publish(label, new_articles)
+            self.processed_links.persist(article['url'] for article in articles)
+            self.stories.persist()
+            self.watermarks.persist(self.source)
+            # 기사가 저장된 뒤에야 목록 페이지를 '본 것' 으로 기록한다
+            http_cache.persist(self.complete_pages)
+            self.metrics.count('saved', added)
+            print(f"{added}개의 기사를 {self.store.shard_dir}에 저장 완료")
+        except Exception as e:
+            print(f"JSON 저장 실패: {e}")
+        if not os.path.exists(self.store.legacy_filename):
+            os.makedirs(os.path.dirname(self.store.legacy_filename), exist_ok=True)
+            with open(self.store.legacy_filename, 'w', encoding='utf-8') as f:
+                json.dump([], f, ensure_ascii=False, indent=2)
+            print(f"{self.store.legacy_filename} 파일이 없어서 빈 파일 생성")
+
+    def publish(self, date_label, articles):
+        """새로 저장한 기사를 카테고리 색인, 검색 인덱스, Parquet 아카이브에도 넣는다. 실패해도 샤드 저장에는 영향이 없다."""
+        if not articles:
+            return
+        try:
+            category_index.add(self.source, self.store.name, date_label, articles)
+        except Exception as e:
+            print(f"카테고리 색인 갱신 실패: {e}")
+        try:
+            # 샤드별 읽은 위치를 같이 옮겨서 다음 sync() 가 같은 줄을 다시 읽지 않게 한다
+            search_index.get_index().sync({self.source: self.store})
+        except Exception as e:
+            print(f"검색 인덱스 갱신 실패: {e}")
+        if parquet_archive is None:
+            return
+        if not os.path.isdir(parquet_archive.ARCHIVE_DIR):
+            # 아카이브가 없는 곳(CI 등)에서는 만들지 않는다. query() 가 필요할 때 샤드에서 만든다
+            return
+        try:
+            # 방금 샤드에 붙은 줄만 읽어 덧붙인다 (샤드별 읽은 위치를 아카이브가 기억한다)
+            parquet_archive.sync({self.source: self.store})
+        except Exception as e:
+            print(f"Parquet 아카이브 저장 실패: {e}")
+
+    def crawl(self):
+        articles = []
+        for url in self.section_urls():
+            articles.extend(self.crawl_section(url))
+        return articles
+
+    def crawl_section(self, section):
+        watermark = self.watermarks.get(self.source, section) if self.use_watermark else None
+        articles = []
+        new_top = None
+        complete = True
+        for page in range(1, self.max_pages + 1):
+            url = self.page_url(section, page)
+            found, top, crossed = self.scrape_list(url, watermark, section)
+            articles.extend(found)
+            if page == 1:
+                new_top = top
+            if url in self.retry_pages:
+                complete = False
+            if crossed or not found:
+                break
+        if self.use_watermark and new_top is not None:
+            if complete:
+                # 다음 실행은 이번 첫 페이지 맨 위 기사까지만 본다 (save 에서 저장)
+                self.watermarks.set(self.source, section, detail_cache.normalize_url(new_top['url']), new_top['time'])
+            else:
+                # 뒤 페이지에 다시 볼 기사가 남았으니 지난 워터마크까지 다시 내려간다
+                print(f"다 처리하지 못한 페이지가 있어 워터마크를 그대로 둠: {section}")
+        return articles
+
+    def run(self):
+        if self.request_rate:
+            rate_limiter.configure(self.urls, self.request_rate, self.request_burst, self.request_jitter)
+        self.start_run()
+        articles = self.crawl()
+        if not articles:
+            print("No new articles found")
+        with self.metrics.stage('save'):
+            self.save(articles)
+        counters = self.metrics.counters
+        self.metrics.count('detail_cache_hits', counters['detail_lookups'] - counters['detail_requests'])
+        try:
+            run_report.write(self.metrics)
+        except OSError as e:
+            print(f"실행 리포트 저장 실패: {e}")
+        self.metrics.print_summary()
+        http_cache.print_stats(self.urls, since=self.stat_marks['http_cache'])
+        rate_limiter.print_stats(self.urls, since=self.stat_marks['rate_limiter'])
+        fetch_policy.print_stats(since=self.stat_marks['fetch_policy'])
+        print(f"[story_index] 조회 {counters['story_lookups']}회, 다른 소스와 연결 {counters['story_linked']}건")
+        if self.detail_for_relevance:
+            print(f"제목 단계에서 상세 요청 {self.metrics.counters['detail_avoided']}개 생략 (정책: {self.relevance_policy})")
+        if self.claims.duplicates:
+            print(f"중복 링크 {self.claims.duplicates}개 건너뜀")
+        if self.detail_rules:
+            print(f"[detail_cache] 적중 {counters['detail_cache_hits']}, 미스 {counters['detail_requests']}")
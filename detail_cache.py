@@ -0,0 +1,138 @@
+# detail_cache.py
+# 상세 페이지에서 뽑은 요약/이미지 등을 정규화한 URL 기준으로 저장해 두는 캐시.
+# 여러 섹션·여러 실행·여러 크롤러에서 같은 기사를 다시 받지 않게 한다 (TTL + 최대 개수 제한).
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from singleflight import SingleFlight
+from url_index import STATE_DIR
+
+CACHE_PATH = os.path.join(STATE_DIR, 'detail_cache.sqlite3')
+DEFAULT_TTL = 3 * 24 * 3600  # 3일
+MAX_ENTRIES = 20000
+PRUNE_EVERY = 200  # 열 때 한 번, 그 뒤로 이만큼 넣을 때마다 만료/초과분 정리
+
+# 같은 기사인데 붙었다 떨어졌다 하는 추적용 파라미터
+_TRACKING_PARAMS = {'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+                    'fbclid', 'gclid', 'ref', 'sid'}
+
+
+def normalize_url(url):
+    parts = urlsplit(url.strip())
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k.lower() not in _TRACKING_PARAMS)
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower() or 'https', parts.netloc.lower(), path, urlencode(query), ''))
+
+
+def _has_content(value, required=None):
+    # 추출 실패('' 나 빈 튜플/딕셔너리, 꼭 있어야 할 필드가 빈 딕셔너리)는 저장하지 않아 다음 실행에 다시 시도한다
+    if isinstance(value, dict):
+        if required:
+            return bool(value.get(required))
+        return any(value.values())
+    if isinstance(value, (tuple, list)):
+        return any(value)
+    return bool(value)
+
+
+class DetailCache:
+    def __init__(self, path=CACHE_PATH, ttl=DEFAULT_TTL, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS details ('
+            ' namespace TEXT NOT NULL, url TEXT NOT NULL, value TEXT NOT NULL,'
+            ' stored_at REAL NOT NULL, used_at REAL NOT NULL,'
+            ' PRIMARY KEY (namespace, url))')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS details_used_at ON details (used_at)')
+        self._conn.commit()
+        # 실행마다 새 프로세스라 PRUNE_EVERY 번을 못 채우는 경우가 많으니 (소스별 CI 실행) 열 때도 정리한다
+        self._prune(time.time())
+        self._puts = 0
+
+    def get(self, namespace, url):
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, stored_at FROM details WHERE namespace = ? AND url = ?',
+                (namespace, key)).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                return None
+            self._conn.execute('UPDATE details SET used_at = ? WHERE namespace = ? AND url = ?',
+                               (now, namespace, key))
+            self._conn.commit()
+        value = json.loads(row[0])
+        return tuple(value) if isinstance(value, list) else value
+
+    def put(self, namespace, url, value):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?, ?)',
+                (namespace, normalize_url(url), json.dumps(value, ensure_ascii=False), now, now))
+            self._conn.commit()
+            self._puts += 1
+            if self._puts % PRUNE_EVERY == 0:
+                self._prune(now)
+
+    def _prune(self, now):
+        self._conn.execute('DELETE FROM details WHERE stored_at < ?', (now - self.ttl,))
+        # 최대 개수를 넘으면 가장 오래 안 쓴 것부터 지운다
+        self._conn.execute(
+            'DELETE FROM details WHERE rowid IN ('
+            ' SELECT rowid FROM details ORDER BY used_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,))
+        self._conn.commit()
+
+    def prune(self):
+        with self._lock:
+            self._prune(time.time())
+
+
+_cache = None
+_cache_lock = threading.Lock()
+_flight = SingleFlight()
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DetailCache()
+    return _cache
+
+
+def cached(namespace, required=None):
+    """extract_article_details(url) 같은 함수에 씌우는 데코레이터.
+    required: 결과 딕셔너리에 이 필드가 비어 있으면 저장하지 않는다 (어댑터의 detail_required)."""
+    def decorator(fn):
+        def load(url):
+            cache = get_cache()
+            value = cache.get(namespace, url)
+            if value is not None and _has_content(value, required):
+                return value
+            value = fn(url)
+            if _has_content(value, required):
+                cache.put(namespace, url, value)
+            return value
+
+        @functools.wraps(fn)
+        def wrapper(url):
+            # 같은 URL 을 여러 작업자가 동시에 요청하면 한 번만 받아서 결과를 나눠 준다
+            return _flight.do((namespace, normalize_url(url)), lambda: load(url))
+        return wrapper
+    return decorator
+
@@ -0,0 +1,144 @@
+# fetch_policy.py
+# http_client.get 이 따르는 재시도/차단 정책.
+# - 일시적인 오류(연결 실패, 타임아웃, 5xx/429)는 지수 백오프로 MAX_RETRIES 번까지 다시 시도한다.
+# - 호스트마다 회로 차단기를 둬서 연속 FAILURE_THRESHOLD 번 실패하면 OPEN_SECONDS 동안 바로 실패시킨다.
+#   죽은 사이트 하나(예: VOA, 스카이데일리)의 기사마다 10~20초 타임아웃을 기다리지 않게 하려는 것.
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+MAX_RETRIES = 2             # 첫 요청 + 2번 재시도
+BACKOFF_BASE = 1.0          # 1초, 2초, 4초 ... (0~같은 값만큼 무작위로 더함)
+BACKOFF_MAX = 10.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+FAILURE_THRESHOLD = 5       # 연속 실패 횟수 (재시도 포함)
+OPEN_SECONDS = 120          # 차단 후 다시 한 번 시도해 볼 때까지
+
+
+class CircuitOpenError(requests.RequestException):
+    """회로가 열린 호스트로 요청하려 할 때. 다른 requests 예외처럼 처리하면 된다."""
+
+
+class CircuitBreaker:
+    def __init__(self, host, threshold=FAILURE_THRESHOLD, open_seconds=OPEN_SECONDS):
+        self.host = host
+        self.threshold = threshold
+        self.open_seconds = open_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self.retries = 0
+        self.rejected = 0
+        self.opened = 0
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """열려 있으면 CircuitOpenError. 열린 지 open_seconds 가 지났으면 한 요청만 시험으로 보낸다."""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if self.trial or time.monotonic() - self.opened_at < self.open_seconds:
+                self.rejected += 1
+                raise CircuitOpenError(f"{self.host} 회로 차단 중 (연속 실패 {self.failures}회)")
+            self.trial = True
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                print(f"[fetch_policy] {self.host} 회로 닫힘")
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.trial or (self.opened_at is None and self.failures >= self.threshold):
+                if self.opened_at is None:
+                    self.opened += 1
+                    print(f"[fetch_policy] {self.host} 연속 실패 {self.failures}회, "
+                          f"{self.open_seconds}초 동안 요청 차단")
+                self.opened_at = time.monotonic()
+                self.trial = False
+
+    def record_error(self):
+        """재시도 대상이 아닌 예외 (리디렉션 반복, 잘못된 URL, 디코딩 실패 등).
+        호스트 장애로 세지는 않지만, 시험 요청이었다면 회복을 확인하지 못했으므로 다시 연다."""
+        with self._lock:
+            if not self.trial:
+                return
+        self.record_failure()
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(url):
+    host = urlsplit(url).netloc.lower()
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(host, CircuitBreaker(host))
+    return breaker
+
+
+def backoff(attempt):
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+    return delay + random.uniform(0, delay)
+
+
+def call(url, send, retries=MAX_RETRIES):
+    """send() 로 요청을 보내고 정책대로 다시 시도한다. 마지막 시도의 응답/예외가 그대로 나온다."""
+    breaker = breaker_for(url)
+    for attempt in range(retries + 1):
+        breaker.before_request()
+        last = attempt == retries
+        try:
+            response = send()
+        except TRANSIENT_ERRORS:
+            breaker.record_failure()
+            if last:
+                raise
+        except BaseException:
+            # 시험 요청이 여기서 끝나도 trial 이 남아 호스트가 계속 막히지 않게 한다
+            breaker.record_error()
+            raise
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if last:
+                return response
+        breaker.retries += 1
+        time.sleep(backoff(attempt))
+
+
+def snapshot():
+    """호스트별 누적 (재시도, 차단, 바로 실패) 횟수. print_stats(since=...) 에 넘기면 그 뒤의 몫만 나온다."""
+    with _breakers_lock:
+        return {host: (breaker.retries, breaker.opened, breaker.rejected) for host, breaker in _breakers.items()}
+
+
+def print_stats(urls=None, since=None):
+    hosts = {urlsplit(url).netloc.lower() for url in urls} if urls else set(_breakers)
+    for host in sorted(hosts):
+        breaker = _breakers.get(host)
+        if breaker is None:
+            continue
+        before = (since or {}).get(host, (0, 0, 0))
+        retries, opened, rejected = (breaker.retries - before[0], breaker.opened - before[1],
+                                     breaker.rejected - before[2])
+        if retries or opened:
+            print(f"[fetch_policy] {host}: 재시도 {retries}회, 차단 {opened}회, 바로 실패 {rejected}회")
+
+
+def reset():
+    with _breakers_lock:
+        _breakers.clear()
@@ -0,0 +1,99 @@
+# html_parser.py
+# BeautifulSoup 생성을 한곳에 모은 파서 계층.
+#  - 백엔드: lxml(설치돼 있으면 기본) / html.parser / selectolax
+#  - scope: 크롤러가 실제로 쓰는 컨테이너만 파싱 ('div.section_latest_article', 'ul.list01' 등)
+# 돌려주는 값은 항상 BeautifulSoup 이라서 기존 select/find 코드는 그대로 동작한다.
+# 환경 변수 HTML_PARSER_BACKEND 로 기본 백엔드를 바꿀 수 있다.
+import os
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        # selectolax 1.0 이전 버전
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+BS4_BACKEND = 'lxml' if HAS_LXML else 'html.parser'
+DEFAULT_BACKEND = os.environ.get('HTML_PARSER_BACKEND') or BS4_BACKEND
+
+_SIMPLE_SELECTOR_RE = re.compile(r'^(?P<name>[a-zA-Z][\w-]*)?(?P<classes>(?:\.[\w-]+)*)(?:#(?P<id>[\w-]+))?$')
+_strainers = {}
+
+
+def available_backends():
+    backends = ['html.parser']
+    if HAS_LXML:
+        backends.append('lxml')
+    if SelectolaxParser is not None:
+        backends.append('selectolax')
+    return backends
+
+
+def _class_matcher(class_sets):
+    def match(value):
+        if not value:
+            return False
+        classes = set(value if isinstance(value, list) else value.split())
+        return any(required <= classes for required in class_sets)
+    return match
+
+
+def _build_strainer(scope):
+    """'div.a, ul.b' 같은 단순 선택자를 SoupStrainer 로 바꾼다. 표현할 수 없으면 None."""
+    names, class_sets, ids = set(), [], set()
+    for part in scope.split(','):
+        m = _SIMPLE_SELECTOR_RE.match(part.strip())
+        if not m:
+            return None
+        if m.group('name'):
+            names.add(m.group('name'))
+        if m.group('classes'):
+            class_sets.append(set(m.group('classes').strip('.').split('.')))
+        if m.group('id'):
+            ids.add(m.group('id'))
+    if class_sets and not ids:
+        # 클래스로 거르면 태그 이름은 굳이 보지 않는다 (조금 더 받아도 선택자 결과는 같다)
+        return SoupStrainer(attrs={'class': _class_matcher(class_sets)})
+    if ids and not class_sets:
+        return SoupStrainer(attrs={'id': list(ids)})
+    if names and not class_sets and not ids:
+        return SoupStrainer(list(names))
+    return None
+
+
+def get_strainer(scope):
+    if scope not in _strainers:
+        _strainers[scope] = _build_strainer(scope)
+    return _strainers[scope]
+
+
+def parse(markup, scope=None, backend=None):
+    """markup 을 BeautifulSoup 으로 파싱한다. scope 가 있으면 그 컨테이너만 남긴다."""
+    backend = backend or DEFAULT_BACKEND
+    if backend == 'selectolax':
+        if SelectolaxParser is None:
+            backend = BS4_BACKEND
+        elif scope:
+            # selectolax 로 컨테이너만 빠르게 잘라낸 뒤 그 조각만 bs4 로 만든다
+            nodes = SelectolaxParser(markup).css(scope)
+            fragment = ''.join(node.html for node in nodes)
+            return BeautifulSoup(fragment, BS4_BACKEND)
+        else:
+            backend = BS4_BACKEND
+    if backend == 'lxml' and not HAS_LXML:
+        backend = 'html.parser'
+    strainer = get_strainer(scope) if scope else None
+    if strainer is not None:
+        return BeautifulSoup(markup, backend, parse_only=strainer)
+    return BeautifulSoup(markup, backend)
@@ -0,0 +1,148 @@
+# http_cache.py
+# 섹션 목록 페이지용 조건부 GET 캐시 (ETag / Last-Modified).
+# 304 응답이거나 본문 해시가 지난번과 같으면 None 을 돌려줘서 파싱 자체를 건너뛰게 한다.
+# 새 ETag/본문 해시는 바로 저장하지 않고 pending 으로 두었다가, 그 페이지의 기사가 샤드에 저장된 뒤
+# persist() 로 기록한다. 상세 페이지 실패 등으로 다 처리하지 못한 페이지는 discard() 해서 다음에 다시 본다.
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import http_client
+from url_index import STATE_DIR
+
+CACHE_PATH = os.path.join(STATE_DIR, 'http_cache.sqlite3')
+
+
+class HttpCache:
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            ' url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body_hash TEXT, fetched_at REAL NOT NULL)')
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(pages)')]
+        if 'body' in columns:
+            # 예전 파일은 본문까지 저장했지만 읽는 곳이 없었다. 한 번 비우고 파일을 줄인다
+            if self._conn.execute('UPDATE pages SET body = NULL WHERE body IS NOT NULL').rowcount:
+                self._conn.commit()
+                self._conn.execute('VACUUM')
+        self._conn.commit()
+        self._pending = {}
+        # 호스트별 누적 통계. 실행 하나의 몫은 실행을 시작할 때의 snapshot() 과의 차이로 본다
+        self.stats = defaultdict(lambda: {'fetched': 0, 'not_modified': 0, 'unchanged': 0, 'changed': 0})
+
+    def _lookup(self, url):
+        with self._lock:
+            return self._conn.execute(
+                'SELECT etag, last_modified, body_hash FROM pages WHERE url = ?', (url,)).fetchone()
+
+    def persist(self, urls):
+        """urls 의 pending 검증값을 저장한다. 그 페이지의 기사를 저장한 뒤에 부른다."""
+        with self._lock:
+            rows = [(url,) + self._pending.pop(url) for url in urls if url in self._pending]
+            if not rows:
+                return
+            now = time.time()
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO pages (url, etag, last_modified, body_hash, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                [row + (now,) for row in rows])
+            self._conn.commit()
+
+    def discard(self, url):
+        """다 처리하지 못한 페이지: 검증값을 버려서 다음 실행에서 건너뛰지 않게 한다."""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def _count(self, url, key):
+        with self._lock:
+            self.stats[urlsplit(url).netloc][key] += 1
+
+    def get_if_changed(self, url, headers=None, **kwargs):
+        """지난번 이후 바뀐 페이지면 응답을, 그대로면 None 을 돌려준다."""
+        cached = self._lookup(url)
+        headers = dict(headers or {})
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        response = http_client.get(url, headers=headers, **kwargs)
+        self._count(url, 'fetched')
+
+        if response.status_code == 304:
+            self._count(url, 'not_modified')
+            return None
+        if response.status_code != 200:
+            return response
+
+        body_hash = hashlib.sha1(response.content).hexdigest()
+        with self._lock:
+            self._pending[url] = (response.headers.get('ETag'), response.headers.get('Last-Modified'), body_hash)
+        if cached and cached[2] == body_hash:
+            self._count(url, 'unchanged')
+            return None
+        self._count(url, 'changed')
+        return response
+
+    def snapshot(self):
+        with self._lock:
+            return {host: dict(s) for host, s in self.stats.items()}
+
+    def print_stats(self, urls=None, since=None):
+        hosts = {urlsplit(url).netloc for url in urls} if urls else None
+        for host, s in sorted(self.snapshot().items()):
+            if hosts is not None and host not in hosts:
+                continue
+            before = (since or {}).get(host, {})
+            s = {key: value - before.get(key, 0) for key, value in s.items()}
+            if not s['fetched']:
+                continue
+            skipped = s['not_modified'] + s['unchanged']
+            print(f"[http_cache] {host}: 목록 페이지 {s['fetched']}개 중 {skipped}개 건너뜀 "
+                  f"(304 {s['not_modified']}, 동일 본문 {s['unchanged']})")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpCache()
+    return _cache
+
+
+def get_if_changed(url, **kwargs):
+    return get_cache().get_if_changed(url, **kwargs)
+
+
+def persist(urls):
+    if _cache is not None:
+        _cache.persist(urls)
+
+
+def discard(url):
+    if _cache is not None:
+        _cache.discard(url)
+
+
+def snapshot():
+    """지금까지의 통계. 실행을 시작할 때 받아 두고 print_stats(since=...) 에 넘기면 그 실행 몫만 나온다."""
+    return _cache.snapshot() if _cache is not None else {}
+
+
+def print_stats(urls=None, since=None):
+    """since(snapshot()) 이후 통계. urls 를 주면 그 URL 들의 호스트만 출력한다."""
+    if _cache is not None:
+        _cache.print_stats(urls, since)
@@ -0,0 +1,100 @@
+# http_client.py
+# 모든 크롤러가 같이 쓰는 HTTP 클라이언트.
+# 호스트별 커넥션 풀 + keep-alive 로 같은 사이트에 대한 TCP/TLS 연결을 재사용한다.
+# 요청 간격은 rate_limiter 의 호스트별 토큰 버킷이, 재시도와 회로 차단은 fetch_policy 가 정한다.
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import fetch_policy
+import rate_limiter
+
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 10
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+POOL_CONNECTIONS = 32  # 캐시할 호스트별 풀 개수 (사이트 수보다 넉넉하게)
+POOL_MAXSIZE = 10      # 호스트 하나당 유지할 연결 수 (크롤러 워커 수 이상)
+
+try:
+    import brotli  # noqa: F401  urllib3 가 br 응답을 풀려면 필요
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+_session = None
+_session_lock = threading.Lock()
+
+# 호스트별 동시 요청 상한 (None 이면 제한 없음). 여러 소스를 한 프로세스에서 돌릴 때
+# 같은 사이트에 워커가 몰리지 않도록 러너가 설정한다.
+host_limit = None
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+
+def _new_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def get_session():
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _new_session()
+    return _session
+
+
+def set_host_limit(limit):
+    global host_limit
+    with _host_slots_lock:
+        host_limit = limit
+        _host_slots.clear()
+
+
+def _host_slot(url):
+    if not host_limit:
+        return None
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(host_limit)
+            _host_slots[host] = slot
+    return slot
+
+
+def _send(url, timeout, **kwargs):
+    rate_limiter.acquire(url)
+    slot = _host_slot(url)
+    if slot is None:
+        response = get_session().get(url, timeout=timeout, **kwargs)
+    else:
+        with slot:
+            response = get_session().get(url, timeout=timeout, **kwargs)
+    rate_limiter.observe(url, response)
+    return response
+
+
+def get(url, timeout=DEFAULT_TIMEOUT, retries=fetch_policy.MAX_RETRIES, **kwargs):
+    """requests.get 과 같은 인터페이스. 공유 세션의 풀을 통해 요청하고, 일시적인 오류는 다시 시도한다.
+    회로가 열린 호스트면 기다리지 않고 fetch_policy.CircuitOpenError 를 낸다."""
+    return fetch_policy.call(url, lambda: _send(url, timeout, **kwargs), retries)
+
+
+def close():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,276 @@
+# keyword_matcher.py
+# News_keyword.json 의 포함/제외 키워드를 Aho-Corasick 오토마톤 하나로 컴파일해서
+# 제목 한 번 훑는 것으로 매칭된 키워드와 카테고리를 모두 찾는다.
+# 오래 도는 프로세스(crawl_runner --daemon 등)를 위해 get_matcher() 는 파일이 바뀌면 다시 컴파일한 매처로 바꿔 준다.
+# 매처마다 파일 내용 해시로 만든 버전이 있고, 저장하는 기사에 keyword_version 으로 남는다.
+import hashlib
+import json
+import os
+import threading
+from collections import deque
+
+KEYWORD_FILE = 'News_keyword.json'
+
+
+def _is_word_char(ch):
+    # re 의 유니코드 \w 와 같은 기준
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordMatch:
+    __slots__ = ('entry', 'keyword', 'category', 'kind', 'start', 'end', 'whole_word')
+
+    def __init__(self, entry, keyword, category, kind, start, end, whole_word):
+        self.entry = entry  # 키워드 목록에서의 순번 (같은 키워드가 두 번 있어도 구분)
+        self.keyword = keyword
+        self.category = category
+        self.kind = kind  # 'include' 또는 'exclude'
+        self.start = start
+        self.end = end
+        self.whole_word = whole_word
+
+    def __repr__(self):
+        return f"KeywordMatch({self.keyword!r}, {self.category!r}, {self.kind}, {self.start}:{self.end})"
+
+
+class MatchResult:
+    """한 텍스트에 대한 매칭 결과.
+
+    키워드 목록에 같은 키워드가 여러 카테고리(또는 같은 카테고리에 두 번) 들어 있으면
+    기존 크롤러의 리스트 컴프리헨션처럼 항목마다 따로 센다.
+    """
+
+    def __init__(self, matches, version=None):
+        self.matches = matches
+        self.version = version  # 매칭에 쓴 키워드 목록 버전
+
+    def _select(self, kind, whole_word):
+        seen = set()
+        selected = []
+        for m in self.matches:
+            if m.kind != kind or (whole_word and not m.whole_word):
+                continue
+            if m.entry in seen:
+                continue
+            seen.add(m.entry)
+            selected.append(m)
+        return selected
+
+    def includes(self, whole_word=False):
+        return self._select('include', whole_word)
+
+    def excludes(self, whole_word=False):
+        return self._select('exclude', whole_word)
+
+    def include_count(self, whole_word=False):
+        return len(self.includes(whole_word))
+
+    def has_exclude(self, whole_word=False):
+        return bool(self.excludes(whole_word))
+
+    def include_keywords(self, whole_word=False):
+        return [m.keyword for m in self.includes(whole_word)]
+
+    def exclude_keywords(self, whole_word=False):
+        return [m.keyword for m in self.excludes(whole_word)]
+
+    def categories(self, whole_word=False):
+        cats = []
+        for m in self.includes(whole_word):
+            if m.category not in cats:
+                cats.append(m.category)
+        return cats
+
+
+class KeywordMatcher:
+    def __init__(self, include_groups, exclude_groups, version=None):
+        # include_groups / exclude_groups: [(category, [keyword, ...]), ...]
+        self.version = version
+        self.keywords = [kw for _, items in include_groups for kw in items]
+        self.exclude_keywords = [kw for _, items in exclude_groups for kw in items]
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        entry = 0
+        for kind, groups in (('include', include_groups), ('exclude', exclude_groups)):
+            for category, items in groups:
+                for keyword in items:
+                    if keyword:
+                        self._add(keyword.lower(), (entry, keyword, category, kind))
+                    entry += 1
+        self._build_failure_links()
+
+    @classmethod
+    def from_json(cls, data, version=None):
+        include_groups = [(cat.get('category', ''), cat['items']) for cat in data.get('keywords', [])]
+        exclude_groups = [(cat.get('category', ''), cat['items']) for cat in data.get('exclude_keywords', [])]
+        return cls(include_groups, exclude_groups, version)
+
+    @classmethod
+    def from_bytes(cls, raw):
+        return cls.from_json(json.loads(raw.decode('utf-8')), content_version(raw))
+
+    @classmethod
+    def from_file(cls, path=KEYWORD_FILE):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def _add(self, pattern, entry):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), entry))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # 실패 링크 쪽 출력도 미리 합쳐 두면 탐색 중에 따라갈 필요가 없다
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def match(self, text):
+        """text 를 소문자로 한 번 바꾼 뒤 한 번의 선형 탐색으로 모든 키워드를 찾는다."""
+        matches = []
+        if not text:
+            return MatchResult(matches, self.version)
+        lowered = text.lower()
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        node = 0
+        for i, ch in enumerate(lowered):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                end = i + 1
+                for length, (entry, keyword, category, kind) in out[node]:
+                    start = end - length
+                    matches.append(KeywordMatch(entry, keyword, category, kind, start, end,
+                                                self._is_whole_word(lowered, start, end)))
+        return MatchResult(matches, self.version)
+
+    @staticmethod
+    def _is_whole_word(text, start, end):
+        # re.findall(r'\b\w+\b', text) 로 뽑은 단어와 정확히 같은지 판단
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end]):
+            return False
+        return all(_is_word_char(ch) for ch in text[start:end])
+
+
+def content_version(raw):
+    """키워드 파일 내용으로 만든 짧은 버전 태그 (내용이 같으면 같은 버전)."""
+    return hashlib.blake2b(raw, digest_size=6).hexdigest()
+
+
+def match_fields(result, whole_word=False):
+    """기사에 저장하는 매칭 결과: 포함 키워드(중복 없이), 카테고리, 점수(매칭된 포함 키워드 수), 키워드 버전."""
+    return {
+        'keywords': list(dict.fromkeys(result.include_keywords(whole_word))),
+        'categories': result.categories(whole_word),
+        'match_score': result.include_count(whole_word),
+        'keyword_version': result.version,
+    }
+
+
+def article_match_fields(article, matcher=None):
+    """기사에 저장된 매칭 결과. 없으면 (예전에 저장한 기사) 제목 + 요약으로 다시 매칭한다."""
+    if 'keywords' in article and 'categories' in article:
+        return {
+            'keywords': list(article['keywords']),
+            'categories': list(article['categories']),
+            'match_score': article.get('match_score', len(article['keywords'])),
+            'keyword_version': article.get('keyword_version'),
+        }
+    text = f"{article.get('title') or ''} {article.get('summary') or ''}"
+    return match_fields((matcher or get_matcher()).match(text))
+
+
+class KeywordRegistry:
+    """키워드 파일 하나의 현재 매처. current() 를 부를 때 파일의 mtime/크기가 바뀌었으면
+    내용 해시를 비교해서 실제로 바뀐 경우에만 다시 컴파일하고 통째로 바꿔 끼운다.
+    고치다 만 파일(잘못된 JSON 등)이면 이전 매처를 그대로 쓴다."""
+
+    def __init__(self, path=KEYWORD_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stat = None
+        self.matcher = None
+        self.reloads = 0
+        # 처음 읽을 때 실패하면 (파일이 없거나 잘못됨) 크롤러가 동작할 수 없으므로 예외를 그대로 낸다
+        if self.current() is None:
+            self.matcher = KeywordMatcher.from_file(path)
+
+    def _file_stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def current(self):
+        stat = self._file_stat()
+        if stat is None or stat == self._stat:
+            return self.matcher
+        with self._lock:
+            if stat != self._stat:
+                self._reload(stat)
+        return self.matcher
+
+    def _reload(self, stat):
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            if self.matcher is not None and content_version(raw) == self.matcher.version:
+                self._stat = stat
+                return
+            matcher = KeywordMatcher.from_bytes(raw)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            if self.matcher is None:
+                raise
+            print(f"{self.path} 을(를) 다시 읽지 못해 이전 키워드({self.matcher.version})를 계속 씀: {e}")
+            return
+        previous = self.matcher
+        self.matcher = matcher
+        self._stat = stat
+        if previous is not None:
+            self.reloads += 1
+            print(f"{self.path} 변경 -> 키워드 다시 컴파일 ({previous.version} -> {matcher.version})")
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(path=KEYWORD_FILE):
+    key = os.path.abspath(path)
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(key)
+            if registry is None:
+                registry = KeywordRegistry(path)
+                _registries[key] = registry
+    return registry
+
+
+def get_matcher(path=KEYWORD_FILE):
+    """프로세스 안에서 모든 크롤러가 같이 쓰는 매처. 파일이 바뀌었으면 새로 컴파일한 매처를 돌려준다."""
+    return get_registry(path).current()
@@ -0,0 +1,122 @@
+# near_dup_index.py
+# 비슷한 제목(같은 사건의 다른 언론사 기사 등)을 빠르게 찾는 인덱스.
+# 정규화한 제목의 글자 bigram 으로 후보를 몇 개만 고른 뒤 fuzz.ratio 로 확인한다.
+# 최근 WINDOW_DAYS 일치 제목은 SQLite 에 남겨서 어제 본 기사도 알아본다.
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from fuzzywuzzy import fuzz
+
+from url_index import STATE_DIR
+
+INDEX_PATH = os.path.join(STATE_DIR, 'near_dup.sqlite3')
+DEFAULT_THRESHOLD = 35  # fuzz.ratio 기준 (Google_Crawler.is_similar 와 같은 값)
+WINDOW_DAYS = 3
+MAX_CANDIDATES = 20  # 공유 bigram 이 많은 순으로 이만큼만 fuzz.ratio 로 비교
+
+_WS_RE = re.compile(r'\s+')
+
+
+def normalize_title(title):
+    # 공백 무시, 대소문자 무시 (is_similar 와 같은 정규화)
+    return _WS_RE.sub('', title).lower()
+
+
+def title_grams(norm):
+    if len(norm) < 2:
+        return {norm} if norm else set()
+    return {norm[i:i + 2] for i in range(len(norm) - 1)}
+
+
+class NearDupIndex:
+    def __init__(self, source, path=INDEX_PATH, threshold=DEFAULT_THRESHOLD, window_days=WINDOW_DAYS):
+        self.source = source
+        self.path = path
+        self.threshold = threshold
+        self.window = window_days * 24 * 3600
+        self._lock = threading.Lock()
+        self._titles = {}  # id -> (정규화 제목, 원래 제목)
+        self._grams = {}  # bigram -> {id, ...}
+        self._pending = []
+        self._next_id = 0
+        self.checks = 0
+        self.comparisons = 0
+        self._conn = None
+        if path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS titles ('
+                ' source TEXT NOT NULL, title TEXT NOT NULL, url TEXT NOT NULL, added_at REAL NOT NULL)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS titles_source ON titles (source, added_at)')
+            self._conn.commit()
+            self._load()
+
+    def _load(self):
+        cutoff = time.time() - self.window
+        self._conn.execute('DELETE FROM titles WHERE added_at < ?', (cutoff,))
+        self._conn.commit()
+        rows = self._conn.execute(
+            'SELECT title FROM titles WHERE source = ? ORDER BY added_at', (self.source,)).fetchall()
+        for (title,) in rows:
+            self._insert(title)
+
+    def _insert(self, title):
+        norm = normalize_title(title)
+        title_id = self._next_id
+        self._next_id += 1
+        self._titles[title_id] = (norm, title)
+        for gram in title_grams(norm):
+            self._grams.setdefault(gram, set()).add(title_id)
+
+    def _candidates(self, norm):
+        shared = Counter()
+        for gram in title_grams(norm):
+            shared.update(self._grams.get(gram, ()))
+        return [title_id for title_id, _ in shared.most_common(MAX_CANDIDATES)]
+
+    def find(self, title):
+        """threshold 이상 비슷한 기존 제목을 돌려준다. 없으면 None."""
+        norm = normalize_title(title)
+        with self._lock:
+            self.checks += 1
+            for title_id in self._candidates(norm):
+                other_norm, other_title = self._titles[title_id]
+                # 길이 차이만으로 threshold 에 못 미치면 비교하지 않는다 (fuzz.ratio 반올림 고려)
+                if 200 * min(len(norm), len(other_norm)) < (self.threshold - 0.5) * (len(norm) + len(other_norm)):
+                    continue
+                self.comparisons += 1
+                if fuzz.ratio(norm, other_norm) >= self.threshold:
+                    return other_title
+        return None
+
+    def add(self, title, url=''):
+        """이번 실행에서 받아들인 제목. persist() 전까지는 메모리에만 있다."""
+        with self._lock:
+            self._insert(title)
+            self._pending.append((self.source, title, url, time.time()))
+
+    def __len__(self):
+        return len(self._titles)
+
+    def persist(self):
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows or self._conn is None:
+                return
+            self._conn.executemany('INSERT INTO titles VALUES (?, ?, ?, ?)', rows)
+            self._conn.commit()
+
+    def print_stats(self):
+        print(f"[near_dup] {self.source}: 제목 {len(self)}개, 확인 {self.checks}회, "
+              f"fuzz.ratio 비교 {self.comparisons}회")
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
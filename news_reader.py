@@ -0,0 +1,169 @@
+# news_reader.py
+# news_json/*.json ([{date, articles: [...]}, ...]) 을 통째로 json.load 하지 않고 기사 하나씩 읽는다.
+# 파일을 조금씩 읽으면서 기사 객체 하나만 디코딩하므로 파일이 커져도 메모리는 기사 몇 개 분량만 쓴다.
+# 사용법: python news_reader.py {articles,urls,dates} news_json/naver_News.json [--since 2025-04-01] [--until ...]
+#         [--fields title,url]
+import argparse
+import json
+import sys
+from datetime import date
+
+from article_store import shard_key
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+class _Stream:
+    """파일에서 조금씩 읽어 JSON 값을 하나씩 꺼내는 커서."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _read(self):
+        if self.pos > CHUNK_SIZE:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+        self.buf += chunk
+        return bool(chunk)
+
+    def peek(self):
+        """공백을 건너뛰고 다음 글자를 돌려준다 (파일 끝이면 '')."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._read():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"'{char}' 가 와야 할 자리에 {self.peek()!r} (위치 {self.pos})")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._read():
+                    continue
+                raise
+            # 숫자처럼 버퍼 끝에서 잘렸을 수도 있는 값은 더 읽고 다시 디코딩한다
+            if end == len(self.buf) and not self.eof and self._read():
+                continue
+            self.pos = end
+            return value
+
+    def next_item(self, close):
+        """배열/객체 안에서 다음 항목이 있으면 True (',' 를 먹는다), 닫는 괄호면 False."""
+        char = self.peek()
+        if char == close:
+            self.pos += 1
+            return False
+        if char == ',':
+            self.pos += 1
+        return True
+
+
+def iter_records(path):
+    """(날짜 라벨, 기사) 를 파일 순서대로 하나씩 돌려준다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _Stream(f)
+        stream.expect('[')
+        while stream.next_item(']'):
+            stream.expect('{')
+            date_label, pending = None, None
+            while stream.next_item('}'):
+                key = stream.value()
+                stream.expect(':')
+                if key == 'articles' and stream.peek() == '[':
+                    stream.expect('[')
+                    while stream.next_item(']'):
+                        article = stream.value()
+                        if date_label is None:
+                            # 'articles' 가 'date' 보다 먼저 나온 날은 그날 치만 모아 뒀다가 돌려준다
+                            pending = pending or []
+                            pending.append(article)
+                        else:
+                            yield date_label, article
+                elif key == 'date':
+                    date_label = stream.value()
+                else:
+                    stream.value()
+            for article in pending or ():
+                yield date_label, article
+
+
+def _day(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'날짜는 YYYY-MM-DD 문자열이나 date 여야 합니다: {value!r}')
+
+
+def iter_articles(path, since=None, until=None, fields=None):
+    """기사를 하나씩 돌려준다.
+    since/until: 'YYYY-MM-DD' 또는 date (양쪽 포함). 날짜 라벨을 해석할 수 없는 날은 기간을 주면 건너뛴다.
+    fields: 주면 그 키만 남긴 dict 를 돌려준다 (예: ('title', 'url'))."""
+    since, until = _day(since), _day(until)
+    for date_label, article in iter_records(path):
+        if since or until:
+            day = shard_key(date_label or '')
+            if len(day) != 10 or day[4] != '-':
+                continue
+            if (since and day < since) or (until and day > until):
+                continue
+        if fields is not None:
+            article = {field: article.get(field) for field in fields}
+        yield date_label, article
+
+
+def iter_urls(path, since=None, until=None):
+    for _, article in iter_articles(path, since, until, fields=('url',)):
+        if article['url']:
+            yield article['url']
+
+
+def iter_dates(path):
+    """파일에 있는 날짜 라벨 (나온 순서대로, 중복 없이)."""
+    seen = set()
+    for date_label, _ in iter_records(path):
+        if date_label not in seen:
+            seen.add(date_label)
+            yield date_label
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='news_json 파일을 스트리밍으로 읽기 (JSON Lines 출력)')
+    parser.add_argument('command', choices=('articles', 'urls', 'dates'))
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--since', help='YYYY-MM-DD (포함)')
+    parser.add_argument('--until', help='YYYY-MM-DD (포함)')
+    parser.add_argument('--fields', help='쉼표로 구분한 기사 필드 (articles 명령)')
+    args = parser.parse_args(argv)
+    fields = args.fields.split(',') if args.fields else None
+    out = sys.stdout
+    for path in args.files:
+        if args.command == 'dates':
+            for date_label in iter_dates(path):
+                out.write(date_label + '\n')
+        elif args.command == 'urls':
+            for url in iter_urls(path, args.since, args.until):
+                out.write(url + '\n')
+        else:
+            for date_label, article in iter_articles(path, args.since, args.until, fields):
+                out.write(json.dumps({'date': date_label, 'article': article}, ensure_ascii=False) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,231 @@
+# parquet_archive.py
+# 모든 소스의 기사를 열 기반(Parquet) 아카이브로 모아 둔다. 분석할 때 소스별 JSON 을 통째로 읽지 않기 위한 것.
+#   news_archive/source=<소스>/date=<YYYY-MM-DD>/part-*.parquet   (hive 파티션)
+# 아카이브는 커밋된 샤드(news_json/shards)에서 만드는 파생 데이터라 저장소에 넣지 않는다.
+# sync() 가 샤드마다 읽은 위치(_shard_offsets.json)를 기억해 두고 새로 붙은 기사만 파트 파일로 덧붙인다.
+# query() 는 먼저 sync() 로 따라잡으므로 어느 체크아웃에서든 (CI 에서 지워졌어도) 전체 아카이브를 볼 수 있다.
+# 크롤러는 아카이브가 있을 때만 저장 후 자기 소스를 sync() 한다. export 는 소스 아카이브를 처음부터 다시 만든다.
+# query() 는 필요한 열과 파티션(소스, 날짜)만 읽어 pandas DataFrame 으로 돌려준다.
+# 사용법: python parquet_archive.py export [naver daum ...]
+#         python parquet_archive.py sync [naver daum ...]
+#         python parquet_archive.py compact
+#         python parquet_archive.py query [--since 2025-04-01] [--until ...] [--source naver] [--category 군사]
+#                                         [--columns title,url]
+import argparse
+import json
+import os
+import shutil
+import sys
+import threading
+import uuid
+from datetime import date, datetime
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from article_store import iter_appended, shard_key
+from keyword_matcher import article_match_fields
+
+ARCHIVE_DIR = os.environ.get('CRAWLER_ARCHIVE_DIR', 'news_archive')
+
+SCHEMA = pa.schema([
+    ('date_label', pa.string()),
+    ('title', pa.string()),
+    ('time', pa.string()),
+    ('url', pa.string()),
+    ('img', pa.string()),
+    ('summary', pa.string()),
+    ('story_id', pa.string()),
+    ('keywords', pa.list_(pa.string())),
+    ('categories', pa.list_(pa.string())),
+    ('match_score', pa.int32()),
+    ('keyword_version', pa.string()),
+])
+PARTITIONING = ds.partitioning(pa.schema([('source', pa.string()), ('date', pa.string())]), flavor='hive')
+COLUMNS = ['source', 'date'] + SCHEMA.names
+OFFSETS_FILE = '_shard_offsets.json'  # '_' 로 시작하는 파일은 dataset 이 읽지 않는다
+
+_sync_lock = threading.Lock()
+
+
+def _to_table(date_label, articles):
+    rows = {name: [] for name in SCHEMA.names}
+    for article in articles:
+        fields = article_match_fields(article)
+        rows['date_label'].append(date_label)
+        for field in ('title', 'time', 'url', 'img', 'summary', 'story_id'):
+            rows[field].append(article.get(field) or '')
+        for field in ('keywords', 'categories', 'match_score', 'keyword_version'):
+            rows[field].append(fields[field])
+    return pa.table(rows, schema=SCHEMA)
+
+
+def partition_dir(source, day, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, f'source={source}', f'date={day}')
+
+
+def append(source, date_label, articles, archive_dir=ARCHIVE_DIR):
+    """새 기사들을 그 날짜 파티션에 파트 파일 하나로 덧붙인다."""
+    if not articles:
+        return None
+    directory = partition_dir(source, shard_key(date_label), archive_dir)
+    os.makedirs(directory, exist_ok=True)
+    name = f"part-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+    path = os.path.join(directory, name)
+    # 쓰는 중인 파일은 '.' 으로 시작해 dataset 이 읽지 않게 한다
+    tmp_path = os.path.join(directory, f'.{name}.tmp')
+    pq.write_table(_to_table(date_label, articles), tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def compact(archive_dir=ARCHIVE_DIR):
+    """파트 파일이 여러 개인 파티션을 파일 하나로 합친다 (실행마다 덧붙인 작은 파일 정리)."""
+    merged = 0
+    for root, dirs, files in os.walk(archive_dir):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        parts = sorted(name for name in files if name.endswith('.parquet'))
+        if len(parts) < 2:
+            continue
+        table = pa.concat_tables(pq.read_table(os.path.join(root, name), schema=SCHEMA) for name in parts)
+        name = f'part-compacted-{uuid.uuid4().hex[:8]}.parquet'
+        tmp_path = os.path.join(root, f'.{name}.tmp')
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, os.path.join(root, name))
+        for part in parts:
+            os.remove(os.path.join(root, part))
+        merged += 1
+    return merged
+
+
+def _load_offsets(archive_dir):
+    try:
+        with open(os.path.join(archive_dir, OFFSETS_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_offsets(archive_dir, offsets):
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, OFFSETS_FILE)
+    tmp_path = os.path.join(archive_dir, f'.{OFFSETS_FILE}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(offsets, f, ensure_ascii=False, indent=0)
+    os.replace(tmp_path, path)
+
+
+def sync(stores, archive_dir=ARCHIVE_DIR):
+    """stores({소스 이름: ArticleStore}) 의 샤드에 지난번 이후 붙은 기사를 아카이브에 덧붙인다. 덧붙인 개수."""
+    with _sync_lock:
+        if os.path.isdir(archive_dir) and not os.path.exists(os.path.join(archive_dir, OFFSETS_FILE)):
+            # 읽은 위치 기록 없이 만든 (예전) 아카이브는 다시 읽으면 중복되므로 비우고 처음부터 만든다
+            for name in os.listdir(archive_dir):
+                if name.startswith('source='):
+                    shutil.rmtree(os.path.join(archive_dir, name), ignore_errors=True)
+        offsets = _load_offsets(archive_dir)
+        count = 0
+        for source, date_label, articles in iter_appended(stores, offsets):
+            append(source, date_label, articles, archive_dir)
+            count += len(articles)
+            _save_offsets(archive_dir, offsets)
+        _save_offsets(archive_dir, offsets)
+    return count
+
+
+def export_source(source, store, archive_dir=ARCHIVE_DIR):
+    """소스 아카이브를 지우고 샤드(없으면 예전 JSON)에서 처음부터 다시 만든다."""
+    with _sync_lock:
+        shutil.rmtree(os.path.join(archive_dir, f'source={source}'), ignore_errors=True)
+        offsets = _load_offsets(archive_dir)
+        prefix = f'{store.name}/'
+        _save_offsets(archive_dir, {key: value for key, value in offsets.items() if not key.startswith(prefix)})
+    return sync({source: store}, archive_dir)
+
+
+def sync_all(names=None, archive_dir=ARCHIVE_DIR):
+    """names(생략하면 전체) 소스를 sync() 한다. 모르는 이름은 건너뛴다."""
+    from crawl_runner import SOURCES, source_stores
+    names = [name for name in names if name in SOURCES] if names else list(SOURCES)
+    return sync(source_stores(names), archive_dir) if names else 0
+
+
+def _day(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y-%m-%d')
+    raise TypeError(f'날짜는 YYYY-MM-DD 문자열이나 date 여야 합니다: {value!r}')
+
+
+def dataset(archive_dir=ARCHIVE_DIR):
+    return ds.dataset(archive_dir, format='parquet', partitioning=PARTITIONING, schema=SCHEMA.append(
+        pa.field('source', pa.string())).append(pa.field('date', pa.string())))
+
+
+def query(since=None, until=None, sources=None, categories=None, columns=None, archive_dir=ARCHIVE_DIR,
+          refresh=True):
+    """아카이브에서 조건에 맞는 기사를 DataFrame 으로 읽는다.
+    since/until: 'YYYY-MM-DD' 또는 date (양쪽 포함, 날짜 파티션 단위).
+    sources: ['naver', ...], categories: News_keyword.json 의 카테고리 이름 (하나라도 매칭되면 포함).
+    columns: 읽을 열 (기본: 전체). 조건에 쓰는 파티션 열 외에는 요청한 열만 읽는다.
+    refresh: 먼저 샤드에서 아카이브를 따라잡는다 (없으면 여기서 만든다)."""
+    if refresh:
+        sync_all(sources, archive_dir)
+    columns = list(columns or COLUMNS)
+    if not os.path.isdir(archive_dir):
+        return pa.table({name: pa.array([], SCHEMA.field(name).type if name in SCHEMA.names else pa.string())
+                         for name in columns}).to_pandas()
+    since, until = _day(since), _day(until)
+    condition = None
+    for expression in (
+            ds.field('source').isin(list(sources)) if sources else None,
+            ds.field('date') >= since if since else None,
+            ds.field('date') <= until if until else None):
+        if expression is not None:
+            condition = expression if condition is None else condition & expression
+    read_columns = columns + (['categories'] if categories and 'categories' not in columns else [])
+    table = dataset(archive_dir).to_table(columns=read_columns, filter=condition)
+    if categories:
+        flat = pc.list_flatten(table['categories'])
+        hits = pc.is_in(flat, value_set=pa.array(list(categories), pa.string()))
+        rows = pc.unique(pc.filter(pc.list_parent_indices(table['categories']), hits))
+        table = table.take(rows).select(columns)
+    return table.to_pandas()
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='기사 Parquet 아카이브 (source/date 파티션)')
+    sub = parser.add_subparsers(dest='command', required=True)
+    export_parser = sub.add_parser('export', help='샤드에서 아카이브를 다시 만든다')
+    export_parser.add_argument('sources', nargs='*')
+    sync_parser = sub.add_parser('sync', help='샤드에 새로 붙은 기사만 아카이브에 덧붙인다')
+    sync_parser.add_argument('sources', nargs='*')
+    sub.add_parser('compact', help='파티션마다 파트 파일을 하나로 합친다')
+    query_parser = sub.add_parser('query', help='조건에 맞는 기사 출력')
+    query_parser.add_argument('--since')
+    query_parser.add_argument('--until')
+    query_parser.add_argument('--source', action='append')
+    query_parser.add_argument('--category', action='append')
+    query_parser.add_argument('--columns', default='source,date,title,url')
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        from crawl_runner import source_stores
+        for name, store in source_stores(args.sources).items():
+            print(f"{name}: {export_source(name, store)}개 기사 -> {ARCHIVE_DIR}")
+    elif args.command == 'sync':
+        print(f"{sync_all(args.sources)}개 기사 추가 -> {ARCHIVE_DIR}")
+    elif args.command == 'compact':
+        print(f"{compact()}개 파티션 합침")
+    else:
+        frame = query(args.since, args.until, args.source, args.category, args.columns.split(','))
+        print(frame.to_string(max_rows=50))
+        print(f"{len(frame)}개")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,120 @@
+# profiling.py
+# --profile 옵션: 실행 전체를 cProfile(CPU) 과 tracemalloc(메모리) 으로 잡아 파일로 남기고 상위 N 개를 요약한다.
+# 크롤러는 작업자 스레드(ThreadPoolExecutor, crawl_runner 의 소스 스레드)에서 일하므로
+# 프로파일 중에 시작한 스레드마다 따로 cProfile 을 붙였다가 끝에서 합친다.
+# Python 3.12 부터는 cProfile 이 sys.monitoring 을 써서 프로파일러 하나가 모든 스레드를 잡고,
+# 스레드마다 또 켜면 ValueError(Another profiling tool is already active) 가 나므로 메인 프로파일러만 쓴다.
+# 결과: <dir>/<이름>-<시각>.pstats (python -m pstats 로 열기), .tracemalloc (tracemalloc.Snapshot.load), .txt 요약
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+DEFAULT_DIR = 'profiles'
+DEFAULT_TOP = 25
+PER_THREAD_PROFILES = sys.version_info < (3, 12)
+
+# 어디에 시간을 쓰는지 대략 나눠 보기 위한 파일 경로 조각 (tottime 합계)
+AREAS = {
+    'HTML 파싱 (bs4/lxml/selectolax)': ('bs4', 'lxml', 'selectolax', 'soupsieve', 'html5lib', 'html/parser'),
+    '키워드 매칭 (keyword_matcher/re)': ('keyword_matcher', 'fuzzywuzzy', 'Levenshtein', '/re/', "'re.Pattern'"),
+    '네트워크 대기 (socket/ssl)': ('socket', 'ssl', 'selectors', "method 'recv", "method 'read' of '_ssl"),
+    'SQLite (캐시/인덱스)': ('sqlite3',),
+}
+
+
+def add_arguments(parser):
+    parser.add_argument('--profile', action='store_true', help='cProfile + tracemalloc 으로 실행을 프로파일')
+    parser.add_argument('--profile-dir', default=DEFAULT_DIR, help=f'프로파일 결과 폴더 (기본: {DEFAULT_DIR})')
+    parser.add_argument('--profile-top', type=int, default=DEFAULT_TOP, help='요약에 보일 항목 수')
+
+
+def _area_seconds(stats):
+    totals = dict.fromkeys(AREAS, 0.0)
+    for (filename, _, funcname), (_, _, tottime, _, _) in stats.stats.items():
+        where = f'{filename}:{funcname}'
+        for area, needles in AREAS.items():
+            if any(needle in where for needle in needles):
+                totals[area] += tottime
+                break
+    return totals
+
+
+@contextmanager
+def profiled(name, out_dir=DEFAULT_DIR, top=DEFAULT_TOP):
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+    thread_profiles = []
+    lock = threading.Lock()
+
+    def start_thread_profile(frame, event, arg):
+        # 새 스레드의 첫 이벤트에서 그 스레드 전용 프로파일러로 바꾼다
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # 다른 프로파일러가 이미 모든 스레드를 잡고 있다. 스레드를 죽이지 말고 그쪽에 맡긴다
+            return
+        with lock:
+            thread_profiles.append(profile)
+
+    tracemalloc.start()
+    main_profile = cProfile.Profile()
+    if PER_THREAD_PROFILES:
+        threading.setprofile(start_thread_profile)
+    main_profile.enable()
+    try:
+        yield
+    finally:
+        main_profile.disable()
+        if PER_THREAD_PROFILES:
+            threading.setprofile(None)
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        with lock:
+            profiles = [main_profile] + thread_profiles
+        stats = pstats.Stats(*profiles, stream=io.StringIO())
+        stats.dump_stats(f'{base}.pstats')
+        snapshot.dump(f'{base}.tracemalloc')
+
+        out = io.StringIO()
+        threads = f'{len(profiles)}개 스레드' if PER_THREAD_PROFILES else '모든 스레드'
+        out.write(f"# {name} 프로파일 ({threads})\n")
+        out.write(f"총 CPU 프로파일 시간 {stats.total_tt:.2f}s (스레드 합계), "
+                  f"메모리 현재 {current / 1024 / 1024:.1f} MiB, 최대 {peak / 1024 / 1024:.1f} MiB\n\n")
+        out.write("## 영역별 자체 시간 (tottime)\n")
+        for area, seconds in sorted(_area_seconds(stats).items(), key=lambda kv: -kv[1]):
+            out.write(f"{seconds:8.2f}s  {area}\n")
+        out.write(f"\n## 누적 시간 상위 {top}개 함수\n")
+        stats.stream = out
+        stats.sort_stats('cumulative').print_stats(top)
+        out.write(f"## 자체 시간 상위 {top}개 함수\n")
+        stats.sort_stats('tottime').print_stats(top)
+        out.write(f"## 메모리 상위 {top}개 위치 (실행 끝 시점)\n")
+        for stat in snapshot.statistics('lineno')[:top]:
+            out.write(f"{stat}\n")
+        summary = out.getvalue()
+        with open(f'{base}.txt', 'w', encoding='utf-8') as f:
+            f.write(summary)
+
+        # 화면에는 영역별 시간까지만, 함수/메모리 순위는 .txt 에
+        print(summary.split('\n## 누적 시간')[0])
+        print(f"[profile] {base}.pstats, {base}.tracemalloc, {base}.txt 저장")
+
+
+@contextmanager
+def maybe_profiled(args, name):
+    """argparse 결과에 --profile 이 있으면 profiled(), 없으면 아무것도 하지 않는다."""
+    if not getattr(args, 'profile', False):
+        yield
+        return
+    with profiled(name, args.profile_dir, args.profile_top):
+        yield
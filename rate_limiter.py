@@ -0,0 +1,132 @@
+# rate_limiter.py
+# 호스트별 토큰 버킷. 고정 sleep 대신 같은 사이트로 가는 요청만 간격을 두고, 다른 사이트는 기다리지 않는다.
+# 소스마다 자기 목록 호스트에 속도(초당 요청 수)를 설정하고 (SiteCrawler.request_rate),
+# 429/503 응답을 받으면 Retry-After 만큼 멈춘 뒤 속도를 절반으로 줄였다가 성공할 때마다 조금씩 되돌린다.
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+THROTTLE_STATUSES = (429, 503)
+MIN_RATE = 0.1           # 줄일 수 있는 최저 속도 (10초에 한 번)
+RECOVERY = 1.1           # 성공 응답마다 속도를 이만큼 곱해 설정값까지 되돌린다
+DEFAULT_RETRY_AFTER = 30  # Retry-After 가 없을 때 멈추는 시간 (초)
+MAX_RETRY_AFTER = 300
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=1, jitter=0.0):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waited = 0.0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """토큰 하나를 예약하고 기다려야 할 시간을 돌려준다 (잠금 밖에서 잔다)."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = max(0.0, -self.tokens / self.rate, self.blocked_until - now)
+            if self.jitter:
+                wait += random.uniform(0, self.jitter)
+            self.waited += wait
+            return wait
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def throttle(self, retry_after):
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(MIN_RATE, self.rate / 2)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def recover(self):
+        if self.rate < self.base_rate:
+            with self._lock:
+                self.rate = min(self.base_rate, self.rate * RECOVERY)
+
+
+def host_of(url):
+    return urlsplit(url).netloc.lower()
+
+
+def configure(urls, rate, burst=1, jitter=0.0):
+    """urls 의 호스트마다 버킷을 둔다. 여러 소스가 같은 호스트를 쓰면 더 느린 설정을 따른다."""
+    with _buckets_lock:
+        for host in {host_of(url) for url in urls}:
+            bucket = _buckets.get(host)
+            if bucket is None or rate < bucket.base_rate:
+                _buckets[host] = TokenBucket(rate, burst, jitter)
+
+
+def acquire(url):
+    bucket = _buckets.get(host_of(url))
+    if bucket is not None:
+        bucket.acquire()
+
+
+def retry_after_seconds(response):
+    value = response.headers.get('Retry-After')
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            seconds = DEFAULT_RETRY_AFTER
+    return min(MAX_RETRY_AFTER, max(0.0, seconds))
+
+
+def observe(url, response):
+    """응답을 보고 속도를 조절한다. 설정 안 된 호스트도 한 번 막히면 그때부터 버킷을 둔다."""
+    host = host_of(url)
+    bucket = _buckets.get(host)
+    if response.status_code in THROTTLE_STATUSES:
+        if bucket is None:
+            with _buckets_lock:
+                bucket = _buckets.setdefault(host, TokenBucket(1.0))
+        retry_after = retry_after_seconds(response)
+        bucket.throttle(retry_after)
+        print(f"[rate_limiter] {host}: {response.status_code}, {retry_after:.0f}초 대기 후 "
+              f"초당 {bucket.rate:.2f}회로 줄임")
+    elif bucket is not None:
+        bucket.recover()
+
+
+def snapshot():
+    """호스트별 누적 (대기 시간, 제한 응답 수). print_stats(since=...) 에 넘기면 그 뒤의 몫만 나온다."""
+    with _buckets_lock:
+        return {host: (bucket.waited, bucket.throttled) for host, bucket in _buckets.items()}
+
+
+def print_stats(urls=None, since=None):
+    hosts = {host_of(url) for url in urls} if urls else set(_buckets)
+    for host in sorted(hosts):
+        bucket = _buckets.get(host)
+        if bucket is not None:
+            waited, throttled = (since or {}).get(host, (0.0, 0))
+            # 더 느린 설정으로 버킷이 바뀌었으면 누적값이 줄어 있을 수 있다
+            print(f"[rate_limiter] {host}: 대기 {max(0.0, bucket.waited - waited):.1f}초, "
+                  f"제한 응답 {max(0, bucket.throttled - throttled)}회, 현재 초당 {bucket.rate:.2f}회")
+
+
+def reset():
+    with _buckets_lock:
+        _buckets.clear()
@@ -0,0 +1,80 @@
+# run_report.py
+# 크롤러 실행마다 단계별 시간과 카운터를 모아 run_report.json (news_json 옆) 에 남긴다.
+# 단계: list_fetch, parse, dedupe, relevance, detail_fetch, save
+# 작업자 스레드에서 도는 단계의 seconds 는 스레드들의 합이라 실행 전체 시간(wall_seconds)보다 클 수 있다.
+# 여러 소스를 한 프로세스에서 돌려도 소스별 항목만 바꿔 쓴다.
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+from article_store import NEWS_JSON_DIR
+
+REPORT_PATH = os.environ.get(
+    'CRAWLER_RUN_REPORT', os.path.join(os.path.dirname(os.path.abspath(NEWS_JSON_DIR)), 'run_report.json'))
+
+_write_lock = threading.Lock()
+
+
+class RunMetrics:
+    def __init__(self, source):
+        self.source = source
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages = defaultdict(lambda: {'seconds': 0.0, 'calls': 0})
+        self.counters = Counter()
+        self.sections = defaultdict(Counter)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.stages[name]['seconds'] += elapsed
+                self.stages[name]['calls'] += 1
+
+    def count(self, key, n=1, section=None):
+        with self._lock:
+            self.counters[key] += n
+            if section is not None:
+                self.sections[section][key] += n
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'started_at': self.started_at,
+                'wall_seconds': round(time.perf_counter() - self._start, 3),
+                'stages': {name: {'seconds': round(stage['seconds'], 3), 'calls': stage['calls']}
+                           for name, stage in self.stages.items()},
+                'counters': dict(self.counters),
+                'sections': {section: dict(counter) for section, counter in self.sections.items()},
+            }
+
+    def print_summary(self):
+        report = self.to_dict()
+        stages = ', '.join(f"{name} {stage['seconds']:.1f}s" for name, stage in
+                           sorted(report['stages'].items(), key=lambda kv: -kv[1]['seconds']))
+        print(f"[run_report] {self.source}: 전체 {report['wall_seconds']:.1f}s ({stages})")
+
+
+def write(metrics, path=REPORT_PATH):
+    """metrics 의 소스 항목만 바꿔서 리포트 파일을 다시 쓴다."""
+    with _write_lock:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            report = {}
+        report.setdefault('sources', {})[metrics.source] = metrics.to_dict()
+        report['generated_at'] = datetime.now().isoformat(timespec='seconds')
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,203 @@
+# search_index.py
+# 모든 소스 기사 제목/요약의 전문 검색 인덱스 (SQLite FTS5).
+# 한국어는 띄어쓰기 단위가 검색어와 잘 맞지 않아서 단어를 글자 2개씩(bigram) 잘라 토큰으로 넣고,
+# 검색어도 같은 방식으로 잘라 이어진 bigram 구(phrase)로 찾는다. "이란" 처럼 두 글자 검색어도 된다.
+# 크롤러가 저장할 때 방금 샤드에 붙은 줄만 읽어 넣고 (SiteCrawler.publish), 검색 전에는 sync() 로 커밋된 샤드에서 따라잡는다.
+# 소스별 워크플로는 STATE_DIR 캐시가 따로라 인덱스도 소스마다 나뉘지만, 샤드는 모두 저장소에 있으므로
+# 어느 체크아웃에서 검색하든 (인덱스가 없으면 처음부터 만들어) 전체 기사를 찾는다. 샤드마다 읽은 위치를 기억한다.
+# 사용법: python search_index.py build [naver daum ...]
+#         python search_index.py search "이란 최고지도자" [--source naver] [--since 2025-04-01] [--limit 20]
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from article_store import iter_appended, shard_key
+from url_index import STATE_DIR
+
+INDEX_PATH = os.path.join(STATE_DIR, 'search_index.sqlite3')
+TITLE_WEIGHT = 3.0  # bm25 에서 제목 매칭을 요약보다 무겁게
+SUMMARY_WEIGHT = 1.0
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def word_grams(word):
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def to_grams(text):
+    """'이란 최고지도자' -> '이란 최고 고지 지도 도자'"""
+    return ' '.join(gram for word in _WORD_RE.findall(text.lower()) for gram in word_grams(word))
+
+
+def to_match_query(query):
+    """검색어를 FTS5 MATCH 식으로: 단어마다 bigram 구, 단어끼리는 AND. 한 글자 단어는 접두어 검색."""
+    terms = []
+    for word in _WORD_RE.findall(query.lower()):
+        if len(word) < 2:
+            terms.append(f'"{word}"*')
+        else:
+            terms.append('"' + ' '.join(word_grams(word)) + '"')
+    return ' AND '.join(terms)
+
+
+class SearchIndex:
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        row = self._conn.execute("SELECT sql FROM sqlite_master WHERE name = 'articles'").fetchone()
+        if row and 'UNIQUE (source, url)' not in row[0]:
+            # 예전 인덱스는 URL 만으로 중복을 걸러 다른 소스의 같은 기사가 빠졌다. 샤드에서 다시 만든다
+            for table in ('articles', 'articles_fts', 'shard_offsets'):
+                self._conn.execute(f'DROP TABLE IF EXISTS {table}')
+        # 같은 기사를 여러 소스가 받으면 (Google/다음이 모아 온 기사 등) 소스마다 한 줄씩 둔다
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS articles ('
+            ' id INTEGER PRIMARY KEY, url TEXT NOT NULL, source TEXT NOT NULL, day TEXT NOT NULL,'
+            ' date_label TEXT NOT NULL, time TEXT NOT NULL, title TEXT NOT NULL, summary TEXT NOT NULL,'
+            ' UNIQUE (source, url))')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS articles_day ON articles (source, day)')
+        # 본문은 articles 에 있으니 FTS 테이블은 토큰만 가진다 (contentless)
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+            " title, summary, content='', tokenize='unicode61 remove_diacritics 0')")
+        self._conn.execute('CREATE TABLE IF NOT EXISTS shard_offsets (path TEXT PRIMARY KEY, offset INTEGER NOT NULL)')
+        self._conn.commit()
+
+    def sync(self, stores):
+        """stores({소스 이름: ArticleStore}) 의 샤드에 지난번 이후 붙은 기사를 넣는다. 넣은 개수를 돌려준다."""
+        with self._lock:
+            offsets = dict(self._conn.execute('SELECT path, offset FROM shard_offsets').fetchall())
+        before = dict(offsets)
+        added = sum(self.add(source, date_label, articles)
+                    for source, date_label, articles in iter_appended(stores, offsets))
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO shard_offsets VALUES (?, ?)',
+                                   [(path, offset) for path, offset in offsets.items() if before.get(path) != offset])
+            self._conn.commit()
+        return added
+
+    def add(self, source, date_label, articles):
+        """새 기사를 넣는다 (그 소스에 이미 있는 URL 은 건너뜀). 넣은 개수를 돌려준다.
+        샤드 읽은 위치는 바꾸지 않으므로 샤드에 저장한 기사는 sync() 로 넣는다."""
+        day = shard_key(date_label)
+        added = 0
+        with self._lock:
+            for article in articles:
+                title = article.get('title') or ''
+                summary = article.get('summary') or ''
+                cursor = self._conn.execute(
+                    'INSERT OR IGNORE INTO articles (url, source, day, date_label, time, title, summary)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (article['url'], source, day, date_label, article.get('time') or '', title, summary))
+                if cursor.rowcount:
+                    self._conn.execute('INSERT INTO articles_fts (rowid, title, summary) VALUES (?, ?, ?)',
+                                       (cursor.lastrowid, to_grams(title), to_grams(summary)))
+                    added += 1
+            self._conn.commit()
+        return added
+
+    def search(self, query, sources=None, since=None, until=None, limit=20):
+        """점수(bm25, 작을수록 관련 높음) 순으로 [{source, date_label, time, title, url, score}, ...]."""
+        match = to_match_query(query)
+        if not match:
+            return []
+        sql = ('SELECT a.source, a.date_label, a.time, a.title, a.url, bm25(articles_fts, ?, ?) AS score'
+               ' FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid WHERE articles_fts MATCH ?')
+        params = [TITLE_WEIGHT, SUMMARY_WEIGHT, match]
+        if sources:
+            sql += f" AND a.source IN ({', '.join('?' * len(sources))})"
+            params.extend(sources)
+        if since:
+            sql += ' AND a.day >= ?'
+            params.append(str(since))
+        if until:
+            sql += ' AND a.day <= ?'
+            params.append(str(until))
+        sql += ' ORDER BY score, a.day DESC LIMIT ?'
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(('source', 'date_label', 'time', 'title', 'url', 'score'), row)) for row in rows]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SearchIndex()
+    return _index
+
+
+def sync_all(names=None):
+    """names(생략하면 전체) 소스의 샤드로 인덱스를 따라잡는다. 모르는 이름은 건너뛴다."""
+    from crawl_runner import SOURCES, source_stores
+    names = [name for name in names if name in SOURCES] if names else list(SOURCES)
+    return get_index().sync(source_stores(names)) if names else 0
+
+
+def search(query, sources=None, since=None, until=None, limit=20, refresh=True):
+    """전체 기사 검색. refresh 면 먼저 샤드에서 인덱스를 따라잡는다 (없으면 여기서 만든다)."""
+    if refresh:
+        sync_all(sources)
+    return get_index().search(query, sources, since, until, limit)
+
+
+def build(names=None):
+    """크롤러 저장소(샤드/예전 JSON)의 히스토리 중 아직 없는 것을 모두 넣는다."""
+    print(f"{sync_all(names)}개 추가, 전체 {len(get_index())}개")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='기사 전문 검색 인덱스 (SQLite FTS5, bigram)')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_parser = sub.add_parser('build', help='히스토리 전체를 인덱스에 넣는다')
+    build_parser.add_argument('sources', nargs='*')
+    search_parser = sub.add_parser('search', help='검색')
+    search_parser.add_argument('query')
+    search_parser.add_argument('--source', action='append')
+    search_parser.add_argument('--since', help='YYYY-MM-DD')
+    search_parser.add_argument('--until', help='YYYY-MM-DD')
+    search_parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        build(args.sources)
+        return 0
+    added = sync_all(args.source)
+    if added:
+        print(f"샤드에서 {added}개 추가")
+    start = time.perf_counter()
+    hits = search(args.query, args.source, args.since, args.until, args.limit, refresh=False)
+    elapsed = (time.perf_counter() - start) * 1000
+    for hit in hits:
+        print(f"{hit['score']:7.2f}  [{hit['source']}] {hit['date_label']}  {hit['title']}\n         {hit['url']}")
+    print(f"{len(hits)}건 ({elapsed:.1f} ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,62 @@
+# singleflight.py
+# 여러 스레드(크롤러별 ThreadPoolExecutor, crawl_runner 의 소스 스레드)가 같은 URL 을 동시에 보는 경우를 막는다.
+# - ClaimRegistry: 한 실행 안에서 URL(정규화한 키)을 먼저 차지한 작업자만 처리한다 (확인과 등록이 한 번에).
+# - SingleFlight: 같은 키의 호출이 진행 중이면 새로 부르지 않고 그 결과를 같이 받는다.
+import threading
+
+
+class ClaimRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._claimed = set()
+        self.duplicates = 0
+
+    def claim(self, key):
+        """처음 차지하면 True, 이미 다른 작업자가 차지했으면 False."""
+        with self._lock:
+            if key in self._claimed:
+                self.duplicates += 1
+                return False
+            self._claimed.add(key)
+            return True
+
+    def __len__(self):
+        return len(self._claimed)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,137 @@
+# story_index.py
+# 여러 소스에 같이 올라오는 기사(연합뉴스 기사가 네이버/다음/네이트에 다시 뜨는 경우 등)를 묶는 인덱스.
+# 정규화한 제목의 지문(fingerprint)과 정규화한 URL 로 찾고, 먼저 받은 소스의 시간/이미지/요약을 넘겨준다.
+# 다른 소스가 이미 받은 기사는 상세 페이지를 다시 받지 않고 story_id 로 서로 연결한다.
+# 모든 크롤러가 프로세스에 하나인 인덱스(get_index)와 STATE_DIR 의 SQLite 파일을 같이 쓴다.
+# 소스마다 따로 도는 워크플로는 STATE_DIR 캐시도 소스마다 따로라서, 실행을 시작할 때 sync() 로
+# 커밋된 샤드(news_json/shards)에서 다른 소스가 최근 WINDOW_DAYS 동안 받은 기사를 가져온다.
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+from article_store import iter_appended
+from detail_cache import normalize_url
+from url_index import STATE_DIR
+
+INDEX_PATH = os.path.join(STATE_DIR, 'story_index.sqlite3')
+WINDOW_DAYS = 3
+
+# 포털이 붙이는 말머리([속보], (종합) 등)와 문장부호는 지문에서 뺀다
+_TAG_RE = re.compile(r'^\s*(?:[\[(【<〈][^\])】>〉]{1,10}[\])】>〉]\s*)+')
+_PUNCT_RE = re.compile(r'[\W_]+')
+MIN_FINGERPRINT_CHARS = 8  # 이보다 짧은 제목은 우연히 겹칠 수 있어 지문으로 쓰지 않는다
+
+
+def title_fingerprint(title):
+    norm = _PUNCT_RE.sub('', _TAG_RE.sub('', title)).lower()
+    if len(norm) < MIN_FINGERPRINT_CHARS:
+        return None
+    return hashlib.blake2b(norm.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def canonical_url(url):
+    # http/https, www./m. 차이는 같은 기사로 본다
+    url = normalize_url(url)
+    scheme, rest = url.split('://', 1)
+    host, _, path = rest.partition('/')
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    return f'https://{host}/{path}'
+
+
+class StoryIndex:
+    def __init__(self, path=INDEX_PATH, window_days=WINDOW_DAYS):
+        self.path = path
+        self.window_days = window_days
+        self.window = window_days * 24 * 3600
+        self._lock = threading.Lock()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS stories ('
+            ' story_id TEXT NOT NULL, fingerprint TEXT, canonical_url TEXT NOT NULL,'
+            ' source TEXT NOT NULL, url TEXT NOT NULL, title TEXT NOT NULL,'
+            ' time TEXT NOT NULL, img TEXT NOT NULL, summary TEXT NOT NULL, added_at REAL NOT NULL,'
+            ' PRIMARY KEY (source, canonical_url))')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS stories_fingerprint ON stories (fingerprint)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS stories_url ON stories (canonical_url)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS shard_offsets (path TEXT PRIMARY KEY, offset INTEGER NOT NULL)')
+        self._conn.execute('DELETE FROM stories WHERE added_at < ?', (time.time() - self.window,))
+        self._conn.commit()
+
+    def find(self, title, url, exclude_source=None):
+        """다른 소스가 이미 받은 같은 기사(URL 이나 제목 지문이 같은 것)를 dict 로 돌려준다. 없으면 None."""
+        fingerprint = title_fingerprint(title)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT * FROM stories WHERE (canonical_url = ? OR fingerprint = ?) AND source != ?'
+                ' ORDER BY added_at LIMIT 1',
+                (canonical_url(url), fingerprint, exclude_source or '')).fetchone()
+            if row is None:
+                return None
+        return dict(row)
+
+    def record(self, source, article, story_id=None):
+        """받아들인 기사를 등록하고 story_id 를 돌려준다. 커밋은 persist() 에서."""
+        row = self._row(source, article, story_id)
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO stories VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+        return row[0]
+
+    @staticmethod
+    def _row(source, article, story_id=None):
+        url = canonical_url(article['url'])
+        fingerprint = title_fingerprint(article['title'])
+        story_id = story_id or fingerprint or hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+        return (story_id, fingerprint, url, source, article['url'], article['title'],
+                article.get('time') or '', article.get('img') or '', article.get('summary') or '', time.time())
+
+    def sync(self, stores):
+        """stores({소스 이름: ArticleStore}) 의 최근 샤드에서 아직 없는 기사를 등록한다. 등록한 개수를 돌려준다.
+        다른 워크플로가 커밋한 기사도 이렇게 들어오고, 파일마다 읽은 위치를 기억해서 새로 붙은 줄만 읽는다."""
+        since = (date.today() - timedelta(days=self.window_days)).isoformat()
+        with self._lock:
+            offsets = dict(self._conn.execute('SELECT path, offset FROM shard_offsets').fetchall())
+        before = dict(offsets)
+        added = 0
+        for source, date_label, articles in iter_appended(stores, offsets, since, import_legacy=False):
+            rows = [self._row(source, article, article.get('story_id'))
+                    for article in articles if article.get('url') and article.get('title')]
+            with self._lock:
+                added += self._conn.executemany(
+                    'INSERT OR IGNORE INTO stories VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows).rowcount
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO shard_offsets VALUES (?, ?)',
+                                   [(path, offset) for path, offset in offsets.items() if before.get(path) != offset])
+            self._conn.commit()
+        return added
+
+    def persist(self):
+        with self._lock:
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = StoryIndex()
+    return _index
@@ -0,0 +1,46 @@
+# tests/test_crawl_runner.py
+# source_stores 는 크롤러 모듈을 import 하지 않고 RESULT_FILES 로 저장소를 만든다. 표가 어댑터와 어긋나면 안 된다.
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+import crawl_runner  # noqa: E402
+import story_index  # noqa: E402
+from article_store import ArticleStore  # noqa: E402
+
+
+class SourceStoresTest(unittest.TestCase):
+    def test_result_files_match_adapters(self):
+        self.assertEqual(set(crawl_runner.RESULT_FILES), set(crawl_runner.SOURCES))
+        for name, module in crawl_runner.SOURCES.items():
+            with self.subTest(source=name):
+                crawler_class = type(importlib.import_module(module).crawler)
+                self.assertEqual(crawl_runner.RESULT_FILES[name], crawler_class.result_filename)
+
+    def test_source_stores_does_not_import_crawlers(self):
+        modules = set(crawl_runner.SOURCES.values())
+        loaded = {name: sys.modules.pop(name) for name in modules if name in sys.modules}
+        self.addCleanup(sys.modules.update, loaded)
+        stores = crawl_runner.source_stores(['naver', 'voa'])
+        self.assertEqual(stores['voa'].name, 'voa_News')
+        self.assertFalse(modules & set(sys.modules))
+
+    def test_story_sync_leaves_missing_shard_dirs_alone(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        legacy = os.path.join(root, 'voa_News.json')
+        with open(legacy, 'w', encoding='utf-8') as f:
+            f.write('[]')
+        store = ArticleStore(legacy, shard_root=os.path.join(root, 'shards'))
+        self.assertEqual(story_index.StoryIndex(':memory:').sync({'voa': store}), 0)
+        self.assertFalse(os.path.exists(store.shard_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
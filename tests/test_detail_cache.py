@@ -0,0 +1,60 @@
+# tests/test_detail_cache.py
+# 상세 캐시: 열 때마다 만료/초과분을 정리하고, 꼭 있어야 할 필드가 빠진 결과는 저장하지 않는다.
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+import detail_cache  # noqa: E402
+
+
+def count(cache):
+    return cache._conn.execute('SELECT COUNT(*) FROM details').fetchone()[0]
+
+
+class DetailCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'detail_cache.sqlite3')
+
+    def test_prunes_on_open(self):
+        cache = detail_cache.DetailCache(self.path)
+        for i in range(5):
+            cache.put('naver:detail', f'https://example.com/{i}', {'time': '09:00'})
+        cache._conn.execute('UPDATE details SET stored_at = ? WHERE url LIKE ?',
+                            (time.time() - detail_cache.DEFAULT_TTL - 1, '%/0'))
+        cache._conn.commit()
+        cache._conn.close()
+        self.assertEqual(count(detail_cache.DetailCache(self.path, max_entries=3)), 3)
+        self.assertEqual(count(detail_cache.DetailCache(self.path)), 3)
+
+    def test_result_without_required_field_is_not_cached(self):
+        cache = detail_cache.DetailCache(self.path)
+        extract = mock.Mock(return_value={'img': 'https://example.com/1.jpg', 'time': ''})
+        with mock.patch.object(detail_cache, '_cache', cache):
+            fetch = detail_cache.cached('naver:detail', required='time')(extract)
+            fetch('https://example.com/1')
+            fetch('https://example.com/1')
+        self.assertEqual(extract.call_count, 2)
+        self.assertEqual(count(cache), 0)
+
+    def test_cached_partial_result_is_fetched_again(self):
+        cache = detail_cache.DetailCache(self.path)
+        cache.put('naver:detail', 'https://example.com/1', {'img': 'https://example.com/1.jpg', 'time': ''})
+        extract = mock.Mock(return_value={'img': 'https://example.com/1.jpg', 'time': '2025.04.18. 오전 9:00'})
+        with mock.patch.object(detail_cache, '_cache', cache):
+            fetch = detail_cache.cached('naver:detail', required='time')(extract)
+            self.assertEqual(fetch('https://example.com/1')['time'], '2025.04.18. 오전 9:00')
+            self.assertEqual(fetch('https://example.com/1')['time'], '2025.04.18. 오전 9:00')
+        self.assertEqual(extract.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# tests/test_fetch_policy.py
+# 회로 차단기: 시험(half-open) 요청이 어떤 예외로 끝나도 호스트가 계속 막히지 않아야 한다.
+# 실행: python -m pytest tests  (또는 python -m unittest discover tests)
+import os
+import sys
+import unittest
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fetch_policy  # noqa: E402
+
+URL = 'https://example.com/list'
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def fail(error):
+    def send():
+        raise error
+    return send
+
+
+class HalfOpenTrialTest(unittest.TestCase):
+    def setUp(self):
+        fetch_policy.reset()
+        self.breaker = fetch_policy.breaker_for(URL)
+        self.breaker.open_seconds = 0
+        with mock.patch('builtins.print'):
+            for _ in range(fetch_policy.FAILURE_THRESHOLD):
+                self.breaker.record_failure()
+        self.assertIsNotNone(self.breaker.opened_at)
+
+    def tearDown(self):
+        fetch_policy.reset()
+
+    def test_non_transient_error_in_trial_does_not_leave_trial_set(self):
+        for error in (requests.TooManyRedirects(), requests.exceptions.ContentDecodingError(),
+                      requests.exceptions.InvalidURL(), ValueError('bad body')):
+            with self.subTest(error=type(error).__name__), mock.patch('builtins.print'):
+                with self.assertRaises(type(error)):
+                    fetch_policy.call(URL, fail(error), retries=0)
+                self.assertFalse(self.breaker.trial)
+                self.assertIsNotNone(self.breaker.opened_at)
+
+    def test_host_recovers_after_failed_trial(self):
+        with mock.patch('builtins.print'):
+            with self.assertRaises(requests.TooManyRedirects):
+                fetch_policy.call(URL, fail(requests.TooManyRedirects()), retries=0)
+            response = fetch_policy.call(URL, lambda: Response(200), retries=0)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(self.breaker.opened_at)
+        self.assertFalse(self.breaker.trial)
+
+    def test_non_transient_error_outside_trial_is_not_counted(self):
+        with mock.patch('builtins.print'):
+            fetch_policy.call(URL, lambda: Response(200), retries=0)
+            with self.assertRaises(requests.exceptions.InvalidURL):
+                fetch_policy.call(URL, fail(requests.exceptions.InvalidURL()), retries=0)
+        self.assertEqual(self.breaker.failures, 0)
+        self.assertIsNone(self.breaker.opened_at)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# tests/test_http_cache.py
+# 목록 페이지 통계는 프로세스 누적이라 (crawl_runner, --daemon) 실행마다 snapshot() 이후 몫만 출력해야 한다.
+import io
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+import http_cache  # noqa: E402
+
+NAVER = 'https://news.naver.com/section/100'
+DAUM = 'https://news.daum.net/politics'
+
+
+class RunStatsTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.cache = http_cache.HttpCache(os.path.join(directory, 'http_cache.sqlite3'))
+
+    def printed(self, urls, since):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.cache.print_stats(urls, since)
+        return out.getvalue()
+
+    def test_reports_only_counts_since_snapshot(self):
+        for key in ('fetched', 'fetched', 'not_modified'):
+            self.cache._count(NAVER, key)
+        since = self.cache.snapshot()
+        self.cache._count(NAVER, 'fetched')
+        self.cache._count(NAVER, 'unchanged')
+        self.assertIn('목록 페이지 1개 중 1개 건너뜀 (304 0, 동일 본문 1)', self.printed([NAVER], since))
+
+    def test_hosts_without_new_requests_are_skipped(self):
+        self.cache._count(DAUM, 'fetched')
+        since = self.cache.snapshot()
+        self.cache._count(NAVER, 'fetched')
+        self.assertEqual(self.printed(None, since).count('[http_cache]'), 1)
+        self.assertEqual(self.printed([DAUM], since), '')
+
+
+class StoredBodyTest(unittest.TestCase):
+    def test_old_cache_bodies_are_dropped(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'http_cache.sqlite3')
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE pages (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body_hash TEXT,'
+                     ' body BLOB, fetched_at REAL NOT NULL)')
+        conn.execute('INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)', (NAVER, '"v1"', None, 'abc', b'x' * 4096, 1.0))
+        conn.commit()
+        conn.close()
+
+        cache = http_cache.HttpCache(path)
+        cache._pending[DAUM] = ('"v2"', None, 'def')
+        cache.persist([DAUM])
+        self.assertEqual(cache._lookup(NAVER), ('"v1"', None, 'abc'))
+        self.assertEqual(cache._lookup(DAUM), ('"v2"', None, 'def'))
+        self.assertEqual(cache._conn.execute('SELECT COUNT(*) FROM pages WHERE body IS NOT NULL').fetchone()[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+# tests/test_parse_time.py
+# 연도 없는 시간 형식('%m-%d %H:%M', YNA/Nate)은 올해를 붙여 파싱해야 2월 29일 기사가 버려지지 않는다.
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+import crawler_engine  # noqa: E402
+from Nate_Crawler import NateCrawler  # noqa: E402
+from YNA_Crawler import YNACrawler  # noqa: E402
+
+
+class LeapDay(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2028, 2, 29, 12, 0)
+
+
+class ParseTimeTest(unittest.TestCase):
+    def setUp(self):
+        self.crawler = YNACrawler()
+        patcher = mock.patch.object(crawler_engine, 'datetime', LeapDay)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_month_day_without_year_on_leap_day(self):
+        for crawler in (self.crawler, NateCrawler()):
+            with self.subTest(source=crawler.source):
+                self.assertEqual(crawler.parse_time('02-29 09:30'), datetime(2028, 2, 29, 9, 30))
+
+    def test_full_date_is_unchanged(self):
+        self.assertEqual(self.crawler.parse_time('2025-04-18 20:54'), datetime(2025, 4, 18, 20, 54))
+
+    def test_time_only_uses_today(self):
+        self.assertEqual(self.crawler.parse_time('08:15', ('%H:%M',)), datetime(2028, 2, 29, 8, 15))
+
+    def test_unparseable_returns_none(self):
+        self.assertIsNone(self.crawler.parse_time('어제'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# tests/test_relevance_policy.py
+# 상세 요약까지 보고 판단하는 소스(VOA, 스카이데일리)의 제목 단계 필터.
+# 실제 어댑터를 생성자로 만들고 상태 파일은 임시 폴더에 둔다. 상세 페이지 요청은 fetch_detail 을 바꿔 끼워 센다.
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+import crawler_engine  # noqa: E402
+from Naver_Crawler import NaverCrawler  # noqa: E402
+from SkyDaily_Crawler import SkyDailyCrawler  # noqa: E402
+from VOA_Crawler import VOACrawler  # noqa: E402
+
+SUMMARY = '이란 미사일 발사'
+
+
+def make_crawler(cls):
+    crawler = cls()
+    crawler.fetch_detail = mock.Mock(return_value={'summary': SUMMARY})
+    return crawler
+
+
+def make_item(title, url='https://example.com/1'):
+    return {'title': title, 'url': url, 'time': '', 'img': '', 'summary': ''}
+
+
+class ExcludingVOACrawler(VOACrawler):
+    exclude_mode = 'substring'
+    relevance_policy = 'lossless'
+
+
+@mock.patch.dict(os.environ, {'CRAWLER_RELEVANCE_POLICY': ''})
+class RelevancePolicyTest(unittest.TestCase):
+    def test_shipped_adapters_skip_details_for_keywordless_titles(self):
+        for cls in (VOACrawler, SkyDailyCrawler):
+            with self.subTest(source=cls.source), mock.patch('builtins.print'):
+                crawler = make_crawler(cls)
+                self.assertEqual(crawler.check_item(make_item('오늘의 날씨')), 'title_stage')
+                crawler.fetch_detail.assert_not_called()
+                self.assertGreater(crawler.metrics.counters['detail_avoided'], 0)
+
+    def test_hint_still_reads_summary_when_title_has_a_keyword(self):
+        # 제목의 키워드는 하나뿐이고 나머지는 요약에만 있다
+        crawler = make_crawler(VOACrawler)
+        self.assertIsNone(crawler.check_item(make_item('이란 소식')))
+        crawler.fetch_detail.assert_called_once()
+
+    def test_lossless_rejects_exclude_keyword_in_title_without_detail(self):
+        crawler = make_crawler(ExcludingVOACrawler)
+        self.assertEqual(crawler.check_item(make_item('이란 미사일에 증시 급락')), 'title_stage')
+        crawler.fetch_detail.assert_not_called()
+        self.assertIsNone(crawler.check_item(make_item('이란 외교장관 회담', 'https://example.com/2')))
+        crawler.fetch_detail.assert_called_once()
+
+    def test_lossless_is_the_engine_default(self):
+        self.assertEqual(crawler_engine.SiteCrawler.relevance_policy, 'lossless')
+
+    def test_unknown_policy_is_rejected(self):
+        with mock.patch.dict(os.environ, {'CRAWLER_RELEVANCE_POLICY': 'hnit'}):
+            with self.assertRaises(ValueError):
+                VOACrawler()
+
+    def test_environment_overrides_adapter_policy(self):
+        with mock.patch.dict(os.environ, {'CRAWLER_RELEVANCE_POLICY': 'always'}):
+            crawler = make_crawler(VOACrawler)
+        self.assertEqual(crawler.relevance_policy, 'always')
+        self.assertIsNone(crawler.check_item(make_item('오늘의 날씨')))
+        crawler.fetch_detail.assert_called_once()
+
+
+def linked_story():
+    return {'story_id': 1, 'source': 'daum', 'url': 'https://example.com/daum/1', 'title': '오늘의 날씨',
+            'time': '2025-04-18T09:00:00', 'img': 'https://example.com/1.jpg', 'summary': SUMMARY}
+
+
+@mock.patch.dict(os.environ, {'CRAWLER_RELEVANCE_POLICY': ''})
+class LinkedStorySummaryTest(unittest.TestCase):
+    def test_title_only_adapter_ignores_linked_summary(self):
+        crawler = make_crawler(NaverCrawler)
+        crawler.stories = mock.Mock(find=mock.Mock(return_value=linked_story()))
+        self.assertEqual(crawler.check_item(make_item('오늘의 날씨 소식')), 'irrelevant')
+
+    def test_detail_adapter_judges_on_linked_summary_instead_of_fetching(self):
+        crawler = make_crawler(VOACrawler)
+        crawler.relevance_policy = 'lossless'
+        crawler.stories = mock.Mock(find=mock.Mock(return_value=linked_story()))
+        self.assertIsNone(crawler.check_item(make_item('오늘의 날씨 소식')))
+        crawler.fetch_detail.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# tests/test_run_cli.py
+# 소스별 워크플로는 크롤러가 남긴 step output(materialize)으로 예전 형식 파일을 다시 만들지 정한다.
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+import crawler_engine  # noqa: E402
+from article_store import ArticleStore  # noqa: E402
+from YNA_Crawler import YNACrawler  # noqa: E402
+
+
+class StepOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.output = os.path.join(self.dir, 'github_output')
+        self.crawler = YNACrawler()
+        self.crawler.store = ArticleStore(os.path.join(self.dir, 'yna_News.json'),
+                                          shard_root=os.path.join(self.dir, 'shards'))
+
+    def run_cli(self, saved):
+        def run():
+            self.crawler.start_run(persistent=False)
+            self.crawler.save([])
+            self.crawler.metrics.count('saved', saved)
+
+        with mock.patch.object(self.crawler, 'run', side_effect=run), \
+                mock.patch.dict(os.environ, {'GITHUB_OUTPUT': self.output}), mock.patch('builtins.print'):
+            crawler_engine.run_cli(self.crawler, [])
+        with open(self.output, encoding='utf-8') as f:
+            return dict(line.strip().split('=', 1) for line in f if line.strip())
+
+    def test_nothing_saved_skips_materialize(self):
+        with open(self.crawler.store.legacy_filename, 'w', encoding='utf-8') as f:
+            f.write('[]')
+        self.assertEqual(self.run_cli(0), {'saved': '0', 'materialize': 'false'})
+
+    def test_saved_articles_materialize(self):
+        with open(self.crawler.store.legacy_filename, 'w', encoding='utf-8') as f:
+            f.write('[]')
+        self.assertEqual(self.run_cli(3)['materialize'], 'true')
+
+    def test_missing_legacy_file_materializes_even_though_save_created_it(self):
+        self.assertEqual(self.run_cli(0)['materialize'], 'true')
+        self.assertTrue(os.path.exists(self.crawler.store.legacy_filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# tests/test_search_index.py
+# 검색 인덱스는 (소스, URL) 마다 한 줄: 여러 소스가 받은 같은 기사도 소스로 걸러 찾을 수 있어야 한다.
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+import search_index  # noqa: E402
+from article_store import ArticleStore  # noqa: E402
+
+LABEL = '2025년 04월 18일 금요일'
+ARTICLE = {'title': '이란 최고지도자 발언', 'url': 'https://www.yna.co.kr/view/1', 'time': '2025-04-18T09:00:00'}
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'search_index.sqlite3')
+
+    def store(self, name):
+        legacy = os.path.join(self.dir, f'{name}_News.json')
+        return ArticleStore(legacy, shard_root=os.path.join(self.dir, 'shards'))
+
+    def test_same_url_from_two_sources(self):
+        index = search_index.SearchIndex(self.path)
+        index.add('google', LABEL, [ARTICLE])
+        index.add('daum', LABEL, [ARTICLE])
+        self.assertEqual(len(index), 2)
+        self.assertEqual([hit['source'] for hit in index.search('최고지도자', sources=['daum'])], ['daum'])
+
+    def test_sync_reads_each_shard_line_once(self):
+        index = search_index.SearchIndex(self.path)
+        store = self.store('daum')
+        store.append(LABEL, [ARTICLE])
+        self.assertEqual(index.sync({'daum': store}), 1)
+        store.append(LABEL, [dict(ARTICLE, url='https://www.yna.co.kr/view/2')])
+        self.assertEqual(index.sync({'daum': store}), 1)
+        offsets = dict(index._conn.execute('SELECT path, offset FROM shard_offsets'))
+        self.assertEqual(offsets, {'daum_News/2025-04-18.jsonl': os.path.getsize(store.shard_path(LABEL))})
+        self.assertEqual(index.sync({'daum': store}), 0)
+
+    def test_old_url_unique_index_is_rebuilt(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute('CREATE TABLE articles (id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE, source TEXT NOT NULL,'
+                     ' day TEXT NOT NULL, date_label TEXT NOT NULL, time TEXT NOT NULL, title TEXT NOT NULL,'
+                     ' summary TEXT NOT NULL)')
+        conn.execute('CREATE TABLE shard_offsets (path TEXT PRIMARY KEY, offset INTEGER NOT NULL)')
+        conn.execute("INSERT INTO shard_offsets VALUES ('daum_News/2025-04-18.jsonl', 999)")
+        conn.commit()
+        conn.close()
+        store = self.store('daum')
+        store.append(LABEL, [ARTICLE])
+        self.assertEqual(search_index.SearchIndex(self.path).sync({'daum': store}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
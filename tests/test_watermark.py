@@ -0,0 +1,52 @@
+# tests/test_watermark.py
+# 섹션을 여러 페이지 넘겨 보다가 한 페이지라도 다시 볼 기사가 남으면 워터마크를 옮기지 않아야 한다.
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CRAWLER_STATE_DIR', tempfile.mkdtemp(prefix='crawler_tests_'))
+
+from YNA_Crawler import YNACrawler  # noqa: E402
+
+SECTION = 'https://www.yna.co.kr/politics/all'
+OLD = {'url': 'https://www.yna.co.kr/view/old', 'time': '2025-04-18T08:00:00'}
+
+
+def article(n):
+    return {'title': f'기사 {n}', 'url': f'https://www.yna.co.kr/view/{n}', 'time': f'2025-04-18T09:0{n}:00'}
+
+
+class SectionWatermarkTest(unittest.TestCase):
+    def setUp(self):
+        self.crawler = YNACrawler()
+        self.crawler.start_run(persistent=False)
+        self.crawler.watermarks.set('yna', SECTION, OLD['url'], OLD['time'])
+        self.crawler.watermarks.persist('yna')
+
+    def crawl(self, retry_page):
+        def scrape_list(url, watermark, section):
+            page = int(url.rsplit('/', 1)[1]) if url != SECTION else 1
+            if page == retry_page:
+                self.crawler.retry_pages.append(url)
+            # 1페이지만 온전하면 맨 위 항목을 돌려준다. 3페이지에서 워터마크에 닿는다
+            top = article(page) if page != retry_page else None
+            return [article(page)], top, page == 3
+
+        with mock.patch.object(self.crawler, 'scrape_list', side_effect=scrape_list), \
+                mock.patch('builtins.print'):
+            self.crawler.crawl_section(SECTION)
+        self.crawler.watermarks.persist('yna')
+        return self.crawler.watermarks.get('yna', SECTION)
+
+    def test_advances_when_every_page_completes(self):
+        self.assertEqual(self.crawl(retry_page=None)['url'], 'https://www.yna.co.kr/view/1')
+
+    def test_kept_when_a_later_page_needs_a_retry(self):
+        self.assertEqual(self.crawl(retry_page=2), OLD)
+
+
+if __name__ == '__main__':
+    unittest.main()
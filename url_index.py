@@ -0,0 +1,137 @@
+# url_index.py
+# 실행이 바뀌어도 유지되는 "이미 본 URL" 인덱스 (SQLite).
+# 시작할 때 히스토리 전체를 읽지 않고, 필요한 URL 만 기본키(해시)로 조회한다.
+# 사용법: python url_index.py import [news_json/naver_News.json ...]
+import glob
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from article_store import ArticleStore, NEWS_JSON_DIR
+
+STATE_DIR = os.environ.get('CRAWLER_STATE_DIR', '.crawler_state')
+INDEX_PATH = os.path.join(STATE_DIR, 'url_index.sqlite3')
+
+
+def url_hash(url):
+    # 8바이트 정수 기본키: 인덱스 크기를 URL 길이와 무관하게 유지
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+class UrlIndex:
+    def __init__(self, source, path=INDEX_PATH):
+        self.source = source
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS seen_urls ('
+            ' source TEXT NOT NULL, url_hash INTEGER NOT NULL, url TEXT NOT NULL, added_at REAL NOT NULL,'
+            ' PRIMARY KEY (source, url_hash)) WITHOUT ROWID')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS imported (source TEXT PRIMARY KEY, imported_at REAL NOT NULL)')
+        self._conn.commit()
+
+    def contains(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM seen_urls WHERE source = ? AND url_hash = ?',
+                (self.source, url_hash(url))).fetchone()
+        return row is not None
+
+    def __contains__(self, url):
+        return self.contains(url)
+
+    def add(self, url):
+        self.add_many([url])
+
+    def add_many(self, urls):
+        now = time.time()
+        rows = [(self.source, url_hash(url), url, now) for url in urls]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany('INSERT OR IGNORE INTO seen_urls VALUES (?, ?, ?, ?)', rows)
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM seen_urls WHERE source = ?', (self.source,)).fetchone()[0]
+
+    def is_imported(self):
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM imported WHERE source = ?', (self.source,)).fetchone()
+        return row is not None
+
+    def import_store(self, store):
+        """기존 히스토리(샤드/예전 JSON)의 URL 을 한 번에 넣는다."""
+        self.add_many(store.iter_urls())
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO imported VALUES (?, ?)', (self.source, time.time()))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SeenLinks:
+    """크롤러의 processed_links 자리에 쓰는 집합 비슷한 객체.
+
+    이번 실행에서 처리 중인 URL 은 메모리에만 두고, 저장이 끝난 URL 만 persist() 로 인덱스에 기록한다.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, url):
+        with self._lock:
+            if url in self._pending:
+                return True
+        return url in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def add(self, url):
+        with self._lock:
+            self._pending.add(url)
+
+    def persist(self, urls):
+        self.index.add_many(urls)
+
+
+def open_index(store, path=INDEX_PATH):
+    """소스의 인덱스를 연다. 처음 여는 소스면 히스토리를 한 번 가져온다."""
+    index = UrlIndex(store.name, path)
+    if not index.is_imported():
+        index.import_store(store)
+        print(f"{store.name}: URL {len(index)}개를 {path} 에 가져옴")
+    return index
+
+
+def main(argv):
+    if not argv or argv[0] != 'import':
+        print("사용법: python url_index.py import [news_json/파일.json ...]")
+        return 1
+    files = argv[1:] or sorted(glob.glob(os.path.join(NEWS_JSON_DIR, '*.json')))
+    for legacy_filename in files:
+        store = ArticleStore(legacy_filename)
+        index = UrlIndex(store.name)
+        index.import_store(store)
+        print(f"{store.name}: {len(index)}개")
+        index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
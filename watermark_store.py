@@ -0,0 +1,70 @@
+# watermark_store.py
+# 섹션(목록 URL)마다 지난 실행에서 본 맨 위 기사(URL, 시간)를 기억해 두는 저장소 (SQLite).
+# 여러 페이지를 넘기는 크롤러(YNA, Nate, 국제뉴스)는 이 워터마크에 닿으면 페이지 넘김을 멈추고,
+# 첫 페이지 맨 위 기사가 그대로면 그 섹션을 통째로 건너뛴다.
+import os
+import sqlite3
+import threading
+import time
+
+from url_index import STATE_DIR
+
+STORE_PATH = os.path.join(STATE_DIR, 'watermarks.sqlite3')
+
+
+class WatermarkStore:
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS watermarks ('
+            ' source TEXT NOT NULL, section TEXT NOT NULL, url TEXT NOT NULL, time TEXT NOT NULL,'
+            ' updated_at REAL NOT NULL, PRIMARY KEY (source, section))')
+        self._conn.commit()
+
+    def get(self, source, section):
+        """{'url', 'time'} 또는 None. 아직 저장 안 한 값은 보지 않는다 (같은 실행 안에서 섹션이 겹쳐도 안전)."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, time FROM watermarks WHERE source = ? AND section = ?', (source, section)).fetchone()
+        return {'url': row[0], 'time': row[1]} if row else None
+
+    def set(self, source, section, url, time_text=''):
+        """persist() 에서 저장된다. 기사를 샤드에 쓰기 전에 워터마크가 앞서가지 않게 하려는 것."""
+        with self._lock:
+            self._pending[(source, section)] = (url, time_text)
+
+    def persist(self, source):
+        with self._lock:
+            rows = {key: value for key, value in self._pending.items() if key[0] == source}
+            for key in rows:
+                del self._pending[key]
+            if not rows:
+                return
+            now = time.time()
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?, ?)',
+                [(source, section, url, time_text, now) for (source, section), (url, time_text) in rows.items()])
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = WatermarkStore()
+    return _store